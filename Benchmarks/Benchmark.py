@@ -0,0 +1,140 @@
+from argparse import ArgumentParser
+from asyncio import run
+from functools import wraps
+from json import dumps, loads
+from os import chdir, environ, makedirs
+from os.path import abspath, dirname, join
+from sys import path
+from tempfile import mkdtemp
+from time import perf_counter
+from tracemalloc import get_traced_memory, reset_peak, start
+from types import SimpleNamespace
+from typing import Callable, Dict
+
+from httpx import AsyncClient, MockTransport
+
+from SyntheticServer import SyntheticServer
+
+# The Action Reads Its Configuration At Import Time, So Everything Is Set Up Before The Sources Are Imported
+environ.setdefault("INPUT_GH_TOKEN", "benchmark")
+environ.setdefault("INPUT_WAKATIME_API_KEY", "benchmark")
+environ.setdefault("INPUT_SHOW_LINES_OF_CODE", "True")
+environ.setdefault("INPUT_SHOW_PROFILE_VIEWS", "False")
+environ.setdefault("DEBUG_RUN", "True")
+path.insert(0, join(dirname(dirname(abspath(__file__))), "Sources"))
+
+import GraphicsChartDrawer  # noqa: E402
+import GraphicsSvgDrawer  # noqa: E402
+import Main  # noqa: E402
+import YearlyCommitCalculater  # noqa: E402
+from ManagerCommitStore import CommitStoreManager as CSM  # noqa: E402
+from ManagerDebug import DebugManager as DBM  # noqa: E402
+from ManagerDownload import InitDownloadManager, DownloadManager as DM  # noqa: E402
+from ManagerEnvironment import EnvironmentManager as EM  # noqa: E402
+from ManagerFile import FileManager as FM  # noqa: E402
+from ManagerGithub import GitHubManager as GHM  # noqa: E402
+from ManagerWakaTimeStore import WakaTimeStoreManager as WSM  # noqa: E402
+
+# Stage -> Module It Is Looked Up In At Call Time
+STAGES = {"CalculateCommitData": YearlyCommitCalculater, "CreateLocGraph": GraphicsChartDrawer, "MakeCommitDayTimeList": Main}
+
+
+def TimeStage(timings: Dict[str, float], name: str, fn: Callable) -> Callable:
+    @wraps(fn)
+    async def Timed(*args, **kwargs):
+        started = perf_counter()
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            timings[name] = timings.get(name, 0.0) + perf_counter() - started
+
+    return Timed
+
+
+async def RunOnce(server: SyntheticServer) -> Dict:
+    # Per-Run State Is Reset, On-Disk Caches In The Store Are Kept Like Between Scheduled Runs
+    DM._client = AsyncClient(transport=MockTransport(server.Handle))
+    DM._REMOTE_RESOURCES_CACHE.clear()
+    DM._SHARED_RESOURCES_CACHE.clear()
+    DM._language_colors = None
+    CSM._user_id = None
+    WSM._account, WSM._sync = None, None
+    server.requests, server.bytes_sent = 0, 0
+
+    timings = dict()
+    originals = {stage: getattr(module, stage) for stage, module in STAGES.items()}
+    for stage, fn in originals.items():
+        setattr(STAGES[stage], stage, TimeStage(timings, stage, fn))
+
+    reset_peak()
+    started = perf_counter()
+    try:
+        await InitDownloadManager(GHM.USER.login, GHM.REMOTE_NAME)
+        await TimeStage(timings, "GetStats", Main.GetStats)()
+        await DM._client.aclose()
+    finally:
+        for stage, fn in originals.items():
+            setattr(STAGES[stage], stage, fn)
+
+    return {
+        "wall_time": perf_counter() - started,
+        "requests": server.requests,
+        "request_bytes": server.bytes_sent,
+        "peak_memory": get_traced_memory()[1],
+        "stages": timings,
+    }
+
+
+def Compare(current: Dict, previous: Dict):
+    for run_name in current["runs"]:
+        for metric in ["wall_time", "requests", "peak_memory"]:
+            before, after = previous["runs"][run_name][metric], current["runs"][run_name][metric]
+            ratio = after / before if before else float("inf")
+            print(f"{run_name:>5} {metric:<12} {before:>14.3f} -> {after:>14.3f}  ({ratio:.2f}x)")
+
+
+def Main_():
+    parser = ArgumentParser(description="Benchmark The Stats Pipeline Against A Synthetic GitHub / WakaTime Stand-In.")
+    parser.add_argument("--repositories", type=int, default=50)
+    parser.add_argument("--branches", type=int, default=4)
+    parser.add_argument("--commits", type=int, default=500, help="Commits On The Main Branch Of Each Repository")
+    parser.add_argument("--languages", default="Python:5,Go:3,Rust:2,TypeScript:2,Shell:1", help="Weighted Language Mix")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chart-format", choices=["png", "svg"], default="png")
+    parser.add_argument("--output", help="Write The JSON Results To This File")
+    parser.add_argument("--compare", help="Previous JSON Results To Compare Against")
+    args = parser.parse_args()
+
+    languages = {name: int(weight) for name, weight in (entry.split(":") for entry in args.languages.split(",") if entry)}
+    server = SyntheticServer(args.repositories, args.branches, args.commits, languages, args.seed)
+
+    workdir = mkdtemp(prefix="wakatime-stats-benchmark-")
+    makedirs(join(workdir, "assets"))
+    chdir(workdir)
+    # Also Inside A Job, Where The Store Would Otherwise Land In The Workspace
+    FM.STORE_DIR = join(workdir, ".wakatime-stats")
+    DBM.CreateLogger("ERROR")
+    EM.CHART_FORMAT = args.chart_format
+    STAGES["CreateLocGraph"] = GraphicsSvgDrawer if args.chart_format == "svg" else GraphicsChartDrawer
+    GHM.REMOTE_NAME = "bench/bench"
+    GHM.USER = SimpleNamespace(login="bench", node_id="U_bench", disk_usage=1024, hireable=True, public_repos=10, owned_private_repos=2)
+
+    start()
+    # The First Run Starts From Empty Caches, The Second Reuses What The First Left On Disk
+    results = {
+        "parameters": vars(args) | {"unique_commits": server.unique_commits},
+        "runs": {"cold": run(RunOnce(server)), "warm": run(RunOnce(server))},
+    }
+
+    report = dumps(results, indent=2)
+    print(report)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(report)
+    if args.compare:
+        with open(args.compare) as file:
+            Compare(results, loads(file.read()))
+
+
+if __name__ == "__main__":
+    Main_()
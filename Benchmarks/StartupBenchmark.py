@@ -0,0 +1,64 @@
+from argparse import ArgumentParser
+from json import dumps
+from os import environ
+from os.path import abspath, dirname, join
+from re import match
+from statistics import median
+from subprocess import run
+from sys import executable, exit
+from time import perf_counter
+from typing import List, Tuple
+
+SOURCES = join(dirname(dirname(abspath(__file__))), "Sources")
+
+# Heavy Modules That Only The Sections Needing Them May Load, Never Starting The Action Itself
+HEAVY_MODULES = ["matplotlib", "numpy", "pytz", "git"]
+
+
+def ImportMain() -> Tuple[float, List[Tuple[int, int, str]]]:
+    env = environ | {"INPUT_GH_TOKEN": "benchmark", "INPUT_WAKATIME_API_KEY": "benchmark"}
+    started = perf_counter()
+    result = run([executable, "-X", "importtime", "-c", "import Main"], cwd=SOURCES, env=env, capture_output=True, text=True, check=True)
+    elapsed = perf_counter() - started
+
+    # "import time: <self us> | <cumulative us> | <module name indented two spaces per nesting level>"
+    modules = []
+    for line in result.stderr.splitlines():
+        parsed = match(r"import time:\s+\d+ \|\s+(\d+) \|( +)(\S+)", line)
+        if parsed:
+            modules.append((int(parsed.group(1)), len(parsed.group(2)) // 2, parsed.group(3)))
+    return elapsed, modules
+
+
+def Main_():
+    parser = ArgumentParser(description="Measure How Long Importing The Action Takes With Different Sections Enabled.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-seconds", type=float, help="Fail When The Median Startup Time Exceeds This")
+    parser.add_argument("--output", help="Write The JSON Results To This File")
+    args = parser.parse_args()
+
+    timings, modules = [], []
+    for _ in range(args.runs):
+        elapsed, modules = ImportMain()
+        timings.append(elapsed)
+    loaded = {module.split(".")[0] for _, _, module in modules}
+    leaked = [module for module in HEAVY_MODULES if module in loaded]
+    # Direct Imports Of Main, Which Is The Only Module At Nesting Level 0
+    slowest = sorted((us, module) for us, depth, module in modules if depth == 1)[::-1][:5]
+    results = {
+        "median_seconds": median(timings),
+        "leaked_modules": leaked,
+        "slowest_imports": [{"module": module, "microseconds": us} for us, module in slowest],
+    }
+    failed = bool(leaked) or (args.max_seconds is not None and results["median_seconds"] > args.max_seconds)
+
+    report = dumps(results, indent=2)
+    print(report)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(report)
+    exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    Main_()
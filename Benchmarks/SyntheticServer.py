@@ -0,0 +1,139 @@
+from datetime import date, timedelta
+from json import loads
+from random import Random
+from re import DOTALL, findall, search
+from typing import Dict, List, Optional
+
+from httpx import Request, Response
+
+LINGUIST_YAML = """
+Python:
+  type: programming
+  color: "#3572A5"
+Go:
+  type: programming
+  color: "#00ADD8"
+Rust:
+  type: programming
+  color: "#dea584"
+TypeScript:
+  type: programming
+  color: "#3178c6"
+  aliases:
+  - ts
+Shell:
+  type: programming
+  color: "#89e051"
+"""
+
+
+class SyntheticServer:
+    # Stand-In For GitHub GraphQL, WakaTime, Linguist And The Contributions API, Served Through An httpx MockTransport.
+    # WakaTime Summaries Report Two Hours A Day, Spread Over The Same Five Names In Every Category.
+    # Every Repository Has A Main Branch Plus Feature Branches Forked From A Random Point Of Its History.
+    def __init__(self, repositories: int, branches: int, commits: int, languages: Dict[str, int], seed: int = 0):
+        random = Random(seed)
+        self.requests = 0
+        self.bytes_sent = 0
+        self.repositories: List[Dict] = []
+        self._histories: Dict[str, Dict[str, List[Dict]]] = {}
+
+        oid = 0
+        names, weights = list(languages), list(languages.values())
+        for index in range(repositories):
+            name = f"repo{index}"
+            language = random.choices(names, weights)[0] if names else None
+            self.repositories.append(
+                {
+                    "name": name,
+                    "owner": {"login": "bench"},
+                    "isPrivate": index % 5 == 0,
+                    "isFork": False,
+                    "primaryLanguage": {"name": language} if language else None,
+                }
+            )
+
+            trunk = []
+            for _ in range(commits):
+                oid += 1
+                trunk.append(self._commit(random, oid))
+            trunk.sort(key=lambda commit: commit["committedDate"], reverse=True)
+            history = {"main": trunk}
+            for branch in range(1, branches):
+                extra = []
+                for _ in range(random.randint(0, max(commits // 10, 1))):
+                    oid += 1
+                    extra.append(self._commit(random, oid))
+                fork = random.randint(0, len(trunk))
+                history[f"feature{branch}"] = sorted(extra, key=lambda commit: commit["committedDate"], reverse=True) + trunk[fork:]
+            self._histories[name] = history
+
+    @staticmethod
+    def _commit(random: Random, oid: int) -> Dict:
+        date = f"{random.randint(2015, 2025)}-{random.randint(1, 12):02d}-{random.randint(1, 28):02d}"
+        return {
+            "oid": f"{oid:040x}",
+            "committedDate": f"{date}T{random.randint(0, 23):02d}:{random.randint(0, 59):02d}:00Z",
+            "additions": random.randint(0, 400),
+            "deletions": random.randint(0, 200),
+        }
+
+    @property
+    def unique_commits(self) -> int:
+        return len({commit["oid"] for branches in self._histories.values() for history in branches.values() for commit in history})
+
+    @staticmethod
+    def _page(nodes: List, body: str) -> Dict:
+        first = int(search(r"first: (\d+)", body).group(1))
+        after = search(r'after: "(\d+)"', body)
+        start = int(after.group(1)) if after else 0
+        end = min(start + first, len(nodes))
+        return {"nodes": nodes[start:end], "pageInfo": {"endCursor": str(end), "hasNextPage": end < len(nodes)}}
+
+    def _repository(self, body: str) -> Optional[Dict]:
+        name = search(r'name: "([^"]+)"', body).group(1)
+        if name not in self._histories:
+            return None
+        if "refs(" in body:
+            return {"refs": self._page([{"name": branch} for branch in self._histories[name]], body)}
+        branch = search(r"refs/heads/([^\"]+)\"", body).group(1)
+        history = self._histories[name].get(branch)
+        return {"ref": {"target": {"history": self._page(history, body)}}} if history is not None else {"ref": None}
+
+    def _graphql(self, document: str) -> Dict:
+        data = {"rateLimit": {"cost": 1, "remaining": 4999, "resetAt": "2099-01-01T00:00:00Z"}}
+        if "repositoriesContributedTo(" in document:
+            data["user"] = {"repositoriesContributedTo": self._page([], document)}
+        elif "repositories(" in document:
+            data["user"] = {"repositories": self._page(self.repositories, document)}
+        elif document.lstrip().startswith("{\nr0:"):
+            for alias, body in findall(r"(r\d+): (repository\(.*?)(?=\nr\d+: |\n    rateLimit)", document, DOTALL):
+                data[alias] = self._repository(body)
+        else:
+            data["repository"] = self._repository(document)
+        return {"data": data}
+
+    @staticmethod
+    def _summaries(start: str, end: str) -> List[Dict]:
+        first, last = date.fromisoformat(start), date.fromisoformat(end)
+        activity = [{"name": name, "total_seconds": 1440.0 * (index + 1) / 3} for index, name in enumerate(["Python", "Go", "Rust", "Shell", "YAML"])]
+        days = []
+        for offset in range((last - first).days + 1):
+            day = (first + timedelta(days=offset)).isoformat()
+            summary = {category: activity for category in ["languages", "editors", "projects", "operating_systems"]}
+            days.append(summary | {"grand_total": {"total_seconds": 7200.0}, "range": {"date": day, "timezone": "Europe/Berlin"}})
+        return days
+
+    def Handle(self, request: Request) -> Response:
+        self.requests += 1
+        self.bytes_sent += len(request.content)
+        headers = {"x-ratelimit-remaining": "4999", "x-ratelimit-reset": "4070908800", "x-ratelimit-resource": "graphql"}
+        if request.url.host == "api.github.com":
+            return Response(200, json=self._graphql(loads(request.content)["query"]), headers=headers)
+        if request.url.host == "cdn.jsdelivr.net":
+            return Response(200, content=LINGUIST_YAML.encode("utf-8"), headers={"etag": '"linguist"'})
+        if request.url.path.endswith("all_time_since_today"):
+            return Response(200, json={"data": {"text": "1,234 hrs 56 mins"}})
+        if request.url.host == "wakatime.com":
+            return Response(200, json={"data": self._summaries(request.url.params["start"], request.url.params["end"])})
+        return Response(200, json={"years": [{"year": "2025", "total": 1234}]})
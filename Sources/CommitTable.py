@@ -0,0 +1,138 @@
+from array import array
+from datetime import datetime
+from hashlib import md5
+from typing import Dict, List, Optional, Tuple
+
+from numpy import argsort, bincount, clip, int64, ndarray, searchsorted, stack, unique, zeros
+from numpy import array as np_array
+
+
+class CommitTable:
+    # Commits Are Kept Column-Wise: Typed Arrays While Ingesting, NumPy Arrays Once Frozen
+    def __init__(self):
+        self.repositories: List[str] = []
+        self.languages: List[str] = []
+        self._repository_ids: Dict[str, int] = {}
+        self._language_ids: Dict[str, int] = {}
+
+        self._dates: List[str] = []
+        self._additions = array("q")
+        self._deletions = array("q")
+        self._repository_column = array("i")
+        self._language_column = array("i")
+
+        self.timestamps: Optional[ndarray] = None
+        self.additions: Optional[ndarray] = None
+        self.deletions: Optional[ndarray] = None
+        self.repository_ids: Optional[ndarray] = None
+        self.language_ids: Optional[ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self._additions) if self.timestamps is None else len(self.timestamps)
+
+    @staticmethod
+    def _intern(value: str, values: List[str], ids: Dict[str, int]) -> int:
+        if value not in ids:
+            ids[value] = len(values)
+            values.append(value)
+        return ids[value]
+
+    def Append(self, repository: str, language: Optional[str], committed_date: str, additions: int, deletions: int):
+        self._repository_column.append(self._intern(repository, self.repositories, self._repository_ids))
+        self._language_column.append(-1 if language is None else self._intern(language, self.languages, self._language_ids))
+        # GitHub Dates Are Always UTC ("...Z"), The Suffix Is Dropped So NumPy Can Parse Them Naively
+        self._dates.append(committed_date.rstrip("Z"))
+        self._additions.append(additions)
+        self._deletions.append(deletions)
+
+    def Freeze(self) -> "CommitTable":
+        self.timestamps = np_array(self._dates, dtype="datetime64[s]").astype(int64)
+        self.additions = np_array(self._additions, dtype=int64)
+        self.deletions = np_array(self._deletions, dtype=int64)
+        self.repository_ids = np_array(self._repository_column, dtype=int64)
+        self.language_ids = np_array(self._language_column, dtype=int64)
+        self._dates, self._additions, self._deletions = [], array("q"), array("q")
+        self._repository_column, self._language_column = array("i"), array("i")
+        return self
+
+    def TotalAdditions(self) -> int:
+        return int(self.additions[self.language_ids >= 0].sum())
+
+    # Returns The Sorted Years With Commits And A (Years, 4 Quarters, Languages, [Additions, Deletions]) LOC Cube
+    def QuarterlyLoc(self) -> Tuple[ndarray, ndarray, ndarray]:
+        known = self.language_ids >= 0
+        stamps = self.timestamps[known].astype("datetime64[s]")
+        years, year_index = unique(stamps.astype("datetime64[Y]").astype(int64) + 1970, return_inverse=True)
+        quarters = stamps.astype("datetime64[M]").astype(int64) % 12 // 3
+        languages = len(self.languages)
+
+        cell = (year_index * 4 + quarters) * languages + self.language_ids[known]
+        size = len(years) * 4 * languages
+        loc = zeros((len(years), 4, languages, 2), dtype=int64)
+        loc[..., 0] = bincount(cell, weights=self.additions[known], minlength=size).reshape(len(years), 4, languages)
+        loc[..., 1] = bincount(cell, weights=self.deletions[known], minlength=size).reshape(len(years), 4, languages)
+        present = bincount(cell, minlength=size).reshape(len(years), 4, languages) > 0
+        return years, loc, present
+
+    # Fingerprint Of The Aggregated LOC Data, Equal Across Runs Whenever The Charts Drawn From It Would Be
+    def Digest(self) -> str:
+        years, loc, present = self.QuarterlyLoc()
+        digest = md5("\n".join(self.languages).encode("utf-8"))
+        for values in [years, loc, present]:
+            digest.update(values.tobytes())
+        return digest.hexdigest()
+
+    # Rebuilds The Nested {Year: {Quarter: {Language: {"add", "del"}}}} Layout From The LOC Cube
+    def YearlyData(self) -> Dict:
+        years, loc, present = self.QuarterlyLoc()
+        yearly_data = dict()
+        for y, q, lang in zip(*present.nonzero()):
+            quarter = yearly_data.setdefault(int(years[y]), {}).setdefault(int(q) + 1, {})
+            quarter[self.languages[lang]] = {"add": int(loc[y, q, lang, 0]), "del": int(loc[y, q, lang, 1])}
+        return yearly_data
+
+    # Per Language Ranked Among The Top `limit` Of Any Quarter, In Order Of First Appearance: Its LOC In Those Quarters
+    # As A (Years, 4 Quarters, [Additions, Deletions]) Array, Along With The Sorted Years
+    def TopLanguagesLoc(self, limit: int) -> Tuple[ndarray, Dict[str, ndarray]]:
+        years, loc, present = self.QuarterlyLoc()
+        ranking = self.RankLanguages(loc)[..., :limit]
+        languages = dict()
+        for y in range(len(years)):
+            for q in range(4):
+                for lang in ranking[y, q]:
+                    if present[y, q, lang]:
+                        languages.setdefault(self.languages[lang], zeros((len(years), 4, 2), dtype=int64))[y, q] = loc[y, q, lang]
+        return years, languages
+
+    # UTC Offset In Seconds Of Every Timestamp, Looked Up In Bulk From The Zone's Transition Table. pytz Doesn't Document
+    # That Table, So Zones Without One (Or A pytz Release Not Keeping It) Convert Each Distinct Timestamp Through Its Public API
+    def _utc_offsets(self, time_zone: str) -> ndarray:
+        from pytz import timezone, utc
+
+        zone = timezone(time_zone)
+        if zone is utc:
+            return zeros(len(self.timestamps), dtype=int64)
+        transitions, transition_info = getattr(zone, "_utc_transition_times", None), getattr(zone, "_transition_info", None)
+        if not transitions or not transition_info:
+            stamps, inverse = unique(self.timestamps, return_inverse=True)
+            offsets = np_array([datetime.fromtimestamp(int(stamp), zone).utcoffset().total_seconds() for stamp in stamps], dtype=int64)
+            return offsets[inverse]
+
+        epoch = datetime(1970, 1, 1)
+        starts = np_array([(moment - epoch).total_seconds() for moment in transitions], dtype=int64)
+        offsets = np_array([info[0].total_seconds() for info in transition_info], dtype=int64)
+        return offsets[clip(searchsorted(starts, self.timestamps, side="right") - 1, 0, None)]
+
+    # Counts Commits Per (Time Zone, Weekday Monday First, Quarter Of The Day) In A Single Bincount Pass
+    def DayTimeHistogram(self, time_zones: List[str]) -> ndarray:
+        local = stack([self.timestamps + self._utc_offsets(time_zone) for time_zone in time_zones])
+        day_times = local // 3600 % 24 // 6
+        # 1970-01-01 Was A Thursday, The Fourth Day Of A Monday-First Week
+        week_days = (local // 86400 + 3) % 7
+        cells = (np_array(range(len(time_zones)), dtype=int64)[:, None] * 7 + week_days) * 4 + day_times
+        return bincount(cells.ravel(), minlength=len(time_zones) * 28).reshape(len(time_zones), 7, 4)
+
+    # Languages Ranked By Added Plus Deleted Lines Within Each Year And Quarter, Most Active First
+    @staticmethod
+    def RankLanguages(loc: ndarray) -> ndarray:
+        return argsort(-loc.sum(axis=-1), axis=-1, kind="stable")
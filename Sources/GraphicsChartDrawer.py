@@ -1,33 +1,47 @@
-from typing import Dict
+from asyncio import get_running_loop
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
 
-from numpy import arange, array, add, amax, zeros
+from numpy import arange, array, add, amax, ndarray, zeros
 import matplotlib.patches as mpatches
 import matplotlib.pyplot as plt
 
+from CommitTable import CommitTable
 from ManagerDownload import DownloadManager as DM
 
 MAX_LANGUAGES = 5
 GRAPH_PATH = "./assets/bar_graph.png"  # HardCoded Path
 
+# Batch Runs Draw In Worker Processes, So One User's Chart Doesn't Hold Up The Event Loop Of The Others
+_render_pool: Optional[ProcessPoolExecutor] = None
 
-async def CreateLocGraph(yearly_data: Dict, save_path: str):
-    colors = await DM.GetRemoteYaml("linguist") or {}
-    years = len(yearly_data)
-    year_indexes = arange(years)
 
-    languages_all_loc = dict()
-    for i, year in enumerate(sorted(yearly_data.keys())):
-        for quarter in yearly_data[year]:
-            top_languages = sorted(
-                yearly_data[year][quarter],
-                key=lambda lang: yearly_data[year][quarter][lang]["add"] + yearly_data[year][quarter][lang]["del"],
-                reverse=True,
-            )[:MAX_LANGUAGES]
+def StartRenderPool(workers: int):
+    global _render_pool
+    _render_pool = ProcessPoolExecutor(workers)
+    # Workers Are Forked Right Away, While Matplotlib Is Already Imported And No Other Thread Is Running Yet
+    _render_pool.submit(int).result()
+
+
+def StopRenderPool():
+    if _render_pool is not None:
+        _render_pool.shutdown()
+
 
-            for lang in top_languages:
-                if lang not in languages_all_loc:
-                    languages_all_loc[lang] = zeros((years, 4, 2), dtype=int)
-                languages_all_loc[lang][i][quarter - 1] = array([yearly_data[year][quarter][lang]["add"], yearly_data[year][quarter][lang]["del"]])
+async def CreateLocGraph(commits: CommitTable, save_path: str):
+    colors = await DM.GetLanguageColors()
+    # Only The Top Languages Of Each Quarter Are Drawn, In Order Of First Appearance
+    year_labels, languages_all_loc = commits.TopLanguagesLoc(MAX_LANGUAGES)
+    palette = {language: colors.get(language) or colors.get(language.lower(), "tab:gray") for language in languages_all_loc}
+    if _render_pool is None:
+        DrawLocGraph(year_labels, languages_all_loc, palette, save_path)
+    else:
+        await get_running_loop().run_in_executor(_render_pool, DrawLocGraph, year_labels, languages_all_loc, palette, save_path)
+
+
+def DrawLocGraph(year_labels: ndarray, languages_all_loc: Dict[str, ndarray], palette: Dict[str, str], save_path: str):
+    years = len(year_labels)
+    year_indexes = arange(years)
 
     fig = plt.figure()
     ax = fig.add_axes([0, 0, 1.5, 1])
@@ -35,7 +49,7 @@ async def CreateLocGraph(yearly_data: Dict, save_path: str):
     language_handles = []
 
     for language, values in languages_all_loc.items():
-        color = colors.get(language, {}).get("color", "tab:gray")
+        color = palette[language]
         language_handles.append(mpatches.Patch(color=color, label=language))
 
         for q in range(4):
@@ -48,7 +62,7 @@ async def CreateLocGraph(yearly_data: Dict, save_path: str):
     ax.set_xticks(array([arange(i, i + 0.84, 0.21) for i in year_indexes]).flatten(), labels=["Q1", "Q2", "Q3", "Q4"] * years)
 
     sax = ax.secondary_xaxis("top")
-    sax.set_xticks(year_indexes + 0.42, labels=sorted(yearly_data.keys()))
+    sax.set_xticks(year_indexes + 0.42, labels=year_labels.tolist())
     sax.spines["top"].set_visible(False)
 
     ax.legend(title="Language", handles=language_handles, loc="upper left", bbox_to_anchor=(1, 1), framealpha=0, title_fontproperties={"weight": "bold"})
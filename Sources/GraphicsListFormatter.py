@@ -1,10 +1,11 @@
 from enum import Enum
-from typing import Dict, Tuple, List
-from datetime import datetime
+from typing import Dict, Tuple, List, TYPE_CHECKING
 
-from pytz import timezone, utc
 from ManagerEnvironment import EnvironmentManager as EM
 
+if TYPE_CHECKING:
+    from CommitTable import CommitTable
+
 DAY_TIME_EMOJI = ["🌞", "🌆", "🌃", "🌙"]
 DAY_TIME_NAMES = ["Morning", "Daytime", "Evening", "Night"]
 WEEK_DAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
@@ -66,20 +67,11 @@ def MakeList(
     return "\n".join(data_list)
 
 
-async def MakeCommitDayTimeList(time_zone: str, repositories: Dict, commit_dates: Dict) -> str:
+async def MakeCommitDayTimeList(time_zone: str, commits: "CommitTable") -> str:
     stats = ""
-    day_times = [0] * 4
-    week_days = [0] * 7
-
-    for repo in repositories:
-        repo_name = repo["name"]
-        if repo_name not in commit_dates:
-            continue
-        for committed_date in [d for branch in commit_dates[repo_name].values() for d in branch.values()]:
-            local_date = datetime.strptime(committed_date, "%Y-%m-%dT%H:%M:%SZ")
-            date = local_date.replace(tzinfo=utc).astimezone(timezone(time_zone))
-            day_times[date.hour // 6] += 1
-            week_days[date.isoweekday() - 1] += 1
+    histogram = commits.DayTimeHistogram([time_zone])[0]
+    day_times = histogram.sum(axis=0).tolist()
+    week_days = histogram.sum(axis=1).tolist()
 
     sum_day = sum(day_times)
     sum_week = sum(week_days)
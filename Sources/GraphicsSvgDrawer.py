@@ -0,0 +1,97 @@
+from math import ceil, floor, log10
+from typing import List
+from xml.sax.saxutils import escape
+
+from numpy import zeros, int64
+
+from CommitTable import CommitTable
+from ManagerDownload import DownloadManager as DM
+
+MAX_LANGUAGES = 5
+GRAPH_PATH = "./assets/bar_graph.svg"  # HardCoded Path
+
+# Layout In Pixels: Each Year Is A Group Of Four Quarter Bars, Additions Stacked Above Zero And Deletions Below
+_YEAR_WIDTH = 100
+_BAR_WIDTH = 20
+_BAR_STEP = 21
+_PLOT_HEIGHT = 320
+_MARGIN_LEFT = 80
+_MARGIN_TOP = 40
+_MARGIN_BOTTOM = 30
+_LEGEND_WIDTH = 160
+_DEFAULT_COLOR = "#7f7f7f"
+
+
+def _ticks(bottom: float, top: float) -> List[int]:
+    # Roughly Five Ticks On A 1 / 2 / 5 x 10^n Grid, Always Including Zero
+    span = max(top - bottom, 1)
+    magnitude = 10 ** floor(log10(span / 5)) if span >= 5 else 1
+    step = next(factor * magnitude for factor in [1, 2, 5, 10] if span / (factor * magnitude) <= 6)
+    return list(range(ceil(bottom / step) * step, int(top) + 1, step))
+
+
+async def CreateLocGraph(commits: CommitTable, save_path: str):
+    colors = await DM.GetLanguageColors()
+    # Only The Top Languages Of Each Quarter Are Drawn, In Order Of First Appearance
+    year_labels, languages_all_loc = commits.TopLanguagesLoc(MAX_LANGUAGES)
+    years = len(year_labels)
+
+    # Stack Offsets Of Every Language, (Languages + 1, Years, 4 Quarters, [Additions, Deletions])
+    cumulative = zeros((len(languages_all_loc) + 1, years, 4, 2), dtype=int64)
+    for index, values in enumerate(languages_all_loc.values()):
+        cumulative[index + 1] = cumulative[index] + values
+
+    totals = cumulative[-1].reshape(-1, 2)
+    max_offset = 0.05 * (totals.max() if totals.size else 0)
+    top = (totals[:, 0].max() if totals.size else 0) + max_offset or 1
+    bottom = -(totals[:, 1].max() if totals.size else 0) - max_offset
+
+    def Y(value: float) -> float:
+        return _MARGIN_TOP + (top - value) / (top - bottom) * _PLOT_HEIGHT
+
+    plot_width = max(years, 1) * _YEAR_WIDTH
+    width = _MARGIN_LEFT + plot_width + _LEGEND_WIDTH
+    height = _MARGIN_TOP + _PLOT_HEIGHT + _MARGIN_BOTTOM
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}" font-family="sans-serif" font-size="11">',
+        f'<rect width="{width}" height="{height}" fill="#ffffff"/>',
+    ]
+
+    for tick in _ticks(bottom, top):
+        parts.append(f'<text x="{_MARGIN_LEFT - 6}" y="{Y(tick) + 4:.1f}" text-anchor="end">{tick:,}</text>')
+    label_y = _MARGIN_TOP + _PLOT_HEIGHT / 2
+    parts.append(f'<text x="14" y="{label_y}" transform="rotate(-90 14 {label_y})" text-anchor="middle" font-weight="bold">Lines of Code (LOC)</text>')
+
+    for index, (language, values) in enumerate(languages_all_loc.items()):
+        color = escape(colors.get(language) or colors.get(language.lower(), _DEFAULT_COLOR))
+        rects = []
+        for y, q in zip(*values.any(axis=-1).nonzero()):
+            x = _MARGIN_LEFT + y * _YEAR_WIDTH + q * _BAR_STEP + 4
+            added, deleted = values[y, q]
+            added_below, deleted_above = cumulative[index, y, q]
+            if added:
+                top_y = Y(added_below + added)
+                rects.append(f'<rect x="{x}" y="{top_y:.1f}" width="{_BAR_WIDTH}" height="{Y(added_below) - top_y:.1f}"/>')
+            if deleted:
+                top_y = Y(-deleted_above)
+                rects.append(f'<rect x="{x}" y="{top_y:.1f}" width="{_BAR_WIDTH}" height="{Y(-deleted_above - deleted) - top_y:.1f}"/>')
+        parts.append(f'<g fill="{color}">{"".join(rects)}</g>')
+
+        legend_y = _MARGIN_TOP + 24 + index * 18
+        parts.append(f'<rect x="{_MARGIN_LEFT + plot_width + 20}" y="{legend_y - 10}" width="12" height="12" fill="{color}"/>')
+        parts.append(f'<text x="{_MARGIN_LEFT + plot_width + 38}" y="{legend_y}">{escape(language)}</text>')
+    parts.append(f'<text x="{_MARGIN_LEFT + plot_width + 20}" y="{_MARGIN_TOP + 4}" font-weight="bold">Language</text>')
+
+    zero = Y(0)
+    parts.append(f'<line x1="{_MARGIN_LEFT}" y1="{zero:.1f}" x2="{_MARGIN_LEFT + plot_width}" y2="{zero:.1f}" stroke="#000000" stroke-width="0.5"/>')
+    axis_bottom = _MARGIN_TOP + _PLOT_HEIGHT
+    parts.append(f'<path d="M{_MARGIN_LEFT} {_MARGIN_TOP}V{axis_bottom}H{_MARGIN_LEFT + plot_width}" fill="none" stroke="#000000"/>')
+    for y, year in enumerate(year_labels.tolist()):
+        group = _MARGIN_LEFT + y * _YEAR_WIDTH + 4
+        parts.append(f'<text x="{group + 2 * _BAR_STEP - 0.5}" y="{_MARGIN_TOP - 12}" text-anchor="middle">{year}</text>')
+        for q in range(4):
+            parts.append(f'<text x="{group + q * _BAR_STEP + _BAR_WIDTH / 2}" y="{axis_bottom + 16}" text-anchor="middle">Q{q + 1}</text>')
+    parts.append("</svg>")
+
+    with open(save_path, "w", encoding="utf-8") as file:
+        file.write("".join(parts))
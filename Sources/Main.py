@@ -1,6 +1,15 @@
-from asyncio import run
-from datetime import datetime
-from typing import Dict
+from asyncio import Event, Semaphore, create_task, gather, get_running_loop, run, to_thread, wait_for
+from contextlib import suppress
+from contextvars import Context, copy_context
+from datetime import datetime, timedelta
+from functools import partial
+from hashlib import md5
+from json import load
+from os import cpu_count, makedirs
+from os.path import basename, dirname, isfile, join
+from random import uniform
+from signal import SIGINT, SIGTERM
+from typing import Awaitable, Callable, Dict, Optional, TYPE_CHECKING
 from urllib.parse import quote
 
 from humanize import intword, naturalsize, intcomma
@@ -9,41 +18,58 @@ from ManagerDebug import InitDebugManager, DebugManager as DBM
 from ManagerGithub import InitGithubManager, GitHubManager as GHM
 from ManagerDownload import InitDownloadManager, DownloadManager as DM
 from ManagerEnvironment import EnvironmentManager as EM
+from ManagerFile import FileManager as FM
+from ManagerRateLimit import RateLimitManager as RLM
+from ManagerScope import ScopeManager as SM
+from ManagerWakaTimeStore import WakaTimeStoreManager as WSM
 
-from GraphicsChartDrawer import CreateLocGraph, GRAPH_PATH
-from YearlyCommitCalculater import CalculateCommitData
 from GraphicsListFormatter import MakeList, MakeCommitDayTimeList, MakeLanguagePerRepoList
 
+# Chart Path -> Digest Of The Inputs It Was Last Rendered From
+RENDER_STATE_FILE = "render_state.pick"
+# Each Batch User Gets Its Own Directory Here, Named After Its "user" Entry
+BATCH_USERS_DIR = "users"
 
-async def GetWakaTimeStats(repositories: Dict, commit_dates: Dict) -> str:
+# NumPy, Matplotlib And The Commit Crawler Are Only Imported Once A Section That Needs Them Runs
+if TYPE_CHECKING:
+    from CommitTable import CommitTable
+
+
+async def GetWakaTimeStats(commits: Optional["CommitTable"]) -> str:
     DBM.i("Adding Short WakaTime Stats...")
     stats = ""
+    if not EM.ShowWakaTimeStats():
+        DBM.w("Skipped WakaTime Stats.")
+        return stats
 
-    data = await DM.GetRemoteJson("waka_latest")
-    if not data:
+    # Every Window Is Computed From The Same Locally Stored Daily Summaries
+    windows = [await WSM.Window(days) for days in EM.WAKATIME_WINDOWS]
+    if windows[0] is None:
         DBM.p("WakaTime Data Unavailable!")
         return stats
 
     if EM.SHOW_COMMIT or EM.SHOW_DAYS_OF_WEEK:
         DBM.i("Adding User Commit Day/Time Info...")
-        stats += f"{await MakeCommitDayTimeList(data['data']['timezone'], repositories, commit_dates)}\n\n"
-
-    if EM.SHOW_TIMEZONE or EM.SHOW_LANGUAGE or EM.SHOW_EDITORS or EM.SHOW_PROJECTS or EM.SHOW_OS:
-        no_activity = "No Activity Tracked This Week"
-        stats += "📊 **This Week I Spent Time On** \n\n```text\n"
-
-        if EM.SHOW_TIMEZONE:
-            stats += f"🕑︎ Timezone: {data['data']['timezone']}\n\n"
-        if EM.SHOW_LANGUAGE:
-            stats += f"💬 Languages:\n{MakeList(data['data']['languages']) or no_activity}\n\n"
-        if EM.SHOW_EDITORS:
-            stats += f"🔥 Editors:\n{MakeList(data['data']['editors']) or no_activity}\n\n"
-        if EM.SHOW_PROJECTS:
-            stats += f"🐱‍💻 Projects:\n{MakeList(data['data']['projects']) or no_activity}\n\n"
-        if EM.SHOW_OS:
-            stats += f"💻 Operating System:\n{MakeList(data['data']['operating_systems']) or no_activity}\n\n"
-
-        stats = stats.rstrip() + "\n```\n\n"
+        stats += f"{await MakeCommitDayTimeList(windows[0]['timezone'], commits)}\n\n"
+
+    if EM.ShowWeeklyActivity():
+        for days, data in zip(EM.WAKATIME_WINDOWS, windows):
+            period = "This Week" if days == 7 else f"In The Last {days} Days"
+            no_activity = f"No Activity Tracked {period}"
+            stats += f"📊 **{period} I Spent Time On** \n\n```text\n"
+
+            if EM.SHOW_TIMEZONE and days == EM.WAKATIME_WINDOWS[0]:
+                stats += f"🕑︎ Timezone: {data['timezone']}\n\n"
+            if EM.SHOW_LANGUAGE:
+                stats += f"💬 Languages:\n{MakeList(data['languages']) or no_activity}\n\n"
+            if EM.SHOW_EDITORS:
+                stats += f"🔥 Editors:\n{MakeList(data['editors']) or no_activity}\n\n"
+            if EM.SHOW_PROJECTS:
+                stats += f"🐱‍💻 Projects:\n{MakeList(data['projects']) or no_activity}\n\n"
+            if EM.SHOW_OS:
+                stats += f"💻 Operating System:\n{MakeList(data['operating_systems']) or no_activity}\n\n"
+
+            stats = stats.rstrip() + "\n```\n\n"
 
     DBM.g("WakaTime Stats Added!")
     return stats
@@ -87,25 +113,30 @@ async def CollectUserRepositories() -> Dict:
 async def GetStats() -> str:
     DBM.i("Collecting Stats For README...")
     stats = ""
-    repositories = await CollectUserRepositories()
+    with DBM.Span("Repositories"):
+        repositories = await CollectUserRepositories()
 
+    # Every Section Reading `commits` Is One Of The Conditions Below, So It Is Never Read While None
+    commits = None
     if EM.SHOW_LINES_OF_CODE or EM.SHOW_LOC_CHART or EM.SHOW_COMMIT or EM.SHOW_DAYS_OF_WEEK:
-        yearly_data, commit_data = await CalculateCommitData(repositories)
+        from YearlyCommitCalculater import CalculateCommitData
+
+        with DBM.Span("Commit Data"):
+            commits = await CalculateCommitData(repositories)
     else:
-        yearly_data, commit_data = {}, {}
         DBM.w("Skipped Yearly Data Calculation.")
 
-    if EM.SHOW_TOTAL_CODE_TIME:
+    if EM.ShowTotalCodeTime():
         data = await DM.GetRemoteJson("waka_all")
         if data:
             stats += f"![Code Time](http://img.shields.io/badge/{quote('Code Time (Team)')}-{quote(data['data']['text'])}-blue)\n\n"
 
     if EM.SHOW_PROFILE_VIEWS:
-        views = GHM.REMOTE.get_views_traffic(per="week").count
+        views = (await DM.GetRemoteJson("github_views"))["count"]
         stats += f"![Profile Views](http://img.shields.io/badge/Profile%20Views%20(Team)-{views}-blue)\n\n"
 
     if EM.SHOW_LINES_OF_CODE:
-        total_loc = sum(yearly_data[y][q][d]["add"] for y in yearly_data for q in yearly_data[y] for d in yearly_data[y][q])
+        total_loc = commits.TotalAdditions()
         # Convert The Humanized Intword Output (e.g. "75.5 Thousand") Into PascalCase Words
         # So The Badge Reads Like: "75.5 Thousand Lines Of Code" (Words In PascalCase).
         raw = intword(total_loc)  # e.g. "75.5 thousand"
@@ -124,14 +155,32 @@ async def GetStats() -> str:
     if EM.SHOW_SHORT_INFO:
         stats += await GetShortGithubInfo()
 
-    stats += await GetWakaTimeStats(repositories, commit_data)
+    with DBM.Span("WakaTime Stats"):
+        stats += await GetWakaTimeStats(commits)
 
     if EM.SHOW_LANGUAGE_PER_REPO:
         stats += f"{MakeLanguagePerRepoList(repositories)}\n\n"
 
     if EM.SHOW_LOC_CHART:
-        await CreateLocGraph(yearly_data, GRAPH_PATH)
-        stats += f"**Timeline**\n\n{GHM.UpdateChart('Lines of Code', GRAPH_PATH)}"
+        if EM.CHART_FORMAT == "svg":
+            from GraphicsSvgDrawer import CreateLocGraph, GRAPH_PATH
+        else:
+            from GraphicsChartDrawer import CreateLocGraph, GRAPH_PATH
+
+        with DBM.Span("LOC Chart"):
+            colors = await DM.GetLanguageColors()
+            used_colors = [colors.get(language) or colors.get(language.lower()) for language in commits.languages]
+            digest = md5(f"{EM.CHART_FORMAT} {commits.Digest()} {used_colors}".encode("utf-8")).hexdigest()
+            # The Render Is Kept In The Store Next To Its Inputs' Digest, So Later Runs Can Reuse It
+            chart = FM.StorePath(basename(GRAPH_PATH), user=True)
+            render_state = FM.CacheBinary(RENDER_STATE_FILE, store=True, user=True) or dict()
+            if render_state.get(GRAPH_PATH) == digest and isfile(chart):
+                DBM.g("LOC Chart Inputs Unchanged, Reusing The Previous Render.")
+            else:
+                makedirs(dirname(chart), exist_ok=True)
+                await CreateLocGraph(commits, chart)
+                FM.CacheBinary(RENDER_STATE_FILE, render_state | {GRAPH_PATH: digest}, store=True, user=True)
+            stats += f"**Timeline**\n\n{GHM.UpdateChart('Lines of Code', GRAPH_PATH, chart)}"
 
     if EM.SHOW_UPDATED_DATE:
         stats += f"\n Last Updated On {datetime.now().strftime(EM.UPDATED_DATE_FORMAT)} UTC"
@@ -140,26 +189,138 @@ async def GetStats() -> str:
     return stats
 
 
-async def Main():
-    InitGithubManager()
-    await InitDownloadManager(GHM.USER.login)
+async def UpdateProfile():
+    with DBM.Span("GitHub Setup"):
+        await InitGithubManager()
+    await InitDownloadManager(GHM.USER.login, GHM.REMOTE_NAME, None if EM.DEBUG_RUN else GHM.BaseBranch())
+    if EM.ShowWakaTimeStats():
+        WSM.StartSync()
+    # Debug Runs Don't Publish, So They Need Neither The README Nor A Clone. Static Resources Keep Downloading In The
+    # Background While The Repository Is Cloned, The README Is Only Awaited First When The Sparse Clone Needs Its Path
+    if not EM.DEBUG_RUN and EM.PUBLISH_MODE != "api":
+        if EM.SPARSE_CLONE:
+            await GHM.LoadReadme()
+        await to_thread(GHM.CloneRepository)
     DBM.i("Managers Initialized.")
-    stats = await GetStats()
+    with DBM.Span("Stats"):
+        stats = await GetStats()
 
     if not EM.DEBUG_RUN:
-        GHM.UpdateReadme(stats)
-        GHM.CommitUpdate()
+        await GHM.UpdateReadme(stats)
+        await to_thread(GHM.CommitUpdate)
     else:
         GHM.SetGithubOutput(stats)
 
-    await DM.CloseRemoteResources()
+    usage = RLM.GetUsage()
+    DBM.i(f"GraphQL Points Used : {usage['points_used']}, Remaining : {usage['points_remaining']}.")
+
+
+# Sets Up The Scope Of One Batch User Inside Its Own Context, Which Every Refresh Cycle Runs In Again
+def StartBatchUser(user: Dict):
+    SM.NewScope()
+    EM.GH_TOKEN = user["gh_token"]
+    # Falling Back To Another Key Would Publish Someone Else's Activity, So Users Without One Get No WakaTime Sections
+    EM.WAKATIME_API_KEY = user.get("wakatime_api_key", "")
+    EM.REPOSITORY = user.get("repository", "")
+    FM.USER_DIR = join(BATCH_USERS_DIR, user["user"])
+    DBM._label = f"[{user['user']}] "
+    if not EM.WAKATIME_API_KEY:
+        DBM.w("No WakaTime API Key Given, Skipping WakaTime Sections.")
+    makedirs(FM.UserPath(FM.ASSETS_DIR), exist_ok=True)
+
+
+async def UpdateBatchUser(slots: Semaphore):
+    async with slots:
+        try:
+            await UpdateProfile()
+        finally:
+            DM.CancelRemoteResources()
+
+
+# Updates Every Batch User Concurrently, Sharing The HTTP Client, Caches And Imported Modules
+async def UpdateBatch(users: Dict[str, Context]):
+    DBM.i(f"Updating {len(users)} Users, {EM.BATCH_WORKERS} At A Time...")
+    slots = Semaphore(EM.BATCH_WORKERS)
+    results = await gather(*[create_task(UpdateBatchUser(slots), context=context) for context in users.values()], return_exceptions=True)
+
+    failed = []
+    for name, result in zip(users, results):
+        if isinstance(result, BaseException):
+            DBM.p("Update Of $user Failed : $error", user=name, error=result)
+            failed.append(name)
+    if failed:
+        raise Exception(f"Batch Update Failed For {len(failed)} Of {len(users)} Users: {', '.join(failed)}")
+
+
+def LoadBatch() -> Dict[str, Context]:
+    with open(EM.BATCH_FILE) as file:
+        users = load(file)
+    names = [user.get("user") for user in users]
+    if not all(names) or len(set(names)) != len(names) or not all(user.get("gh_token") for user in users):
+        raise Exception("Every Batch User Needs A Unique 'user' And A 'gh_token'")
+
+    contexts = dict()
+    for user in users:
+        contexts[user["user"]] = copy_context()
+        contexts[user["user"]].run(StartBatchUser, user)
+    return contexts
+
+
+# Service Mode: Refreshes Until Stopped, Keeping The HTTP Pool, Language Colors, Commit Stores And Clones Warm.
+# A Failed Cycle Is Logged And Retried At The Next One.
+async def RunService(update: Callable[[], Awaitable]):
+    stop = Event()
+    for signal in [SIGINT, SIGTERM]:
+        get_running_loop().add_signal_handler(signal, stop.set)
+
+    while not stop.is_set():
+        DM.ExpireSharedResources()
+        try:
+            with DBM.Span("Refresh Cycle"):
+                await update()
+        except Exception as error:
+            DBM.p("Refresh Cycle Failed : $error", error=error)
+        DM.RecordPoolStats()
+        DBM.Report()
+
+        delay = EM.REFRESH_INTERVAL * (1 + uniform(-EM.REFRESH_JITTER, EM.REFRESH_JITTER))
+        DBM.g("Next Refresh In $time.", time=timedelta(seconds=delay))
+        with suppress(TimeoutError):
+            await wait_for(stop.wait(), delay)
+    DBM.g("Service Stopped.")
+
+
+async def Main():
+    if EM.BATCH_FILE:
+        users = LoadBatch()
+        update = partial(UpdateBatch, users)
+    else:
+        update = UpdateProfile
+    # Charts Of Batch Users Are Drawn In Worker Processes, Started Before Anything Else Runs
+    render_pool = EM.BATCH_FILE and EM.SHOW_LOC_CHART and EM.CHART_FORMAT != "svg"
+    if render_pool:
+        from GraphicsChartDrawer import StartRenderPool, StopRenderPool
+
+        StartRenderPool(min(EM.BATCH_WORKERS, cpu_count() or 1))
+
+    try:
+        if EM.REFRESH_INTERVAL > 0:
+            await RunService(update)
+        else:
+            await update()
+    finally:
+        await DM.CloseRemoteResources()
+        if render_pool:
+            StopRenderPool()
 
 
 if __name__ == "__main__":
     InitDebugManager()
     start_time = datetime.now()
     DBM.g("Program Execution Started At $date.", date=start_time)
-    run(Main())
+    with DBM.Span("Total"):
+        run(Main())
     end_time = datetime.now()
+    DBM.Report()
     DBM.g("Program Execution Finished At $date.", date=end_time)
     DBM.p("Program Finished In $time.", time=end_time - start_time)
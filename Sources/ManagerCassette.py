@@ -0,0 +1,88 @@
+from datetime import datetime, timezone
+from hashlib import sha1
+from typing import Dict, List, Optional
+
+from httpx import AsyncBaseTransport, AsyncHTTPTransport, Request, Response
+
+from ManagerDebug import DebugManager as DBM
+from ManagerEnvironment import EnvironmentManager as EM
+from ManagerFile import FileManager as FM
+
+
+class CassetteManager:
+    _CASSETTE_FILE = "http_cassette.pick.gz"
+    # Content Is Stored Decoded, So Transfer Headers Describing The Wire Format Are Dropped
+    _DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+    _entries: Dict[str, List[Dict]] = {}
+    _cursors: Dict[str, int] = {}
+    # When The Recording Started, Kept In The Cassette So Requests Built From Today's Date Replay On Any Later Day
+    _recorded_at: Optional[datetime] = None
+
+    # Requests Are Matched By Method, URL Without Secrets And Body Hash; Repeated Requests Replay In Order
+    @staticmethod
+    def _key(request: Request) -> str:
+        url = request.url.copy_remove_param("api_key")
+        return f"{request.method} {url} {sha1(request.content).hexdigest()}"
+
+    # Called While Modules Are Imported, So Nothing Is Logged Here
+    @staticmethod
+    def Transport() -> Optional[AsyncBaseTransport]:
+        if EM.HTTP_CASSETTE == "record":
+            CassetteManager._recorded_at = datetime.now(timezone.utc)
+            return RecordingTransport(AsyncHTTPTransport())
+        if EM.HTTP_CASSETTE == "replay":
+            cassette = FM.CacheBinary(CassetteManager._CASSETTE_FILE, assets=True, compressed=True) or {}
+            CassetteManager._entries, CassetteManager._recorded_at = cassette.get("entries", {}), cassette.get("recorded_at")
+            return ReplayTransport()
+        return None
+
+    # The Current Time, Or The Start Of The Recording While Recording Or Replaying
+    @staticmethod
+    def Now() -> datetime:
+        return CassetteManager._recorded_at or datetime.now(timezone.utc)
+
+    @staticmethod
+    def Record(request: Request, status_code: int, headers: Dict[str, str], content: bytes):
+        headers = {name: value for name, value in headers.items() if name.lower() not in CassetteManager._DROPPED_HEADERS}
+        entry = {"status_code": status_code, "headers": headers, "content": content}
+        CassetteManager._entries.setdefault(CassetteManager._key(request), []).append(entry)
+
+    @staticmethod
+    def Replay(request: Request) -> Response:
+        key = CassetteManager._key(request)
+        entries = CassetteManager._entries.get(key)
+        if not entries:
+            raise Exception(f"No Recorded Response For {request.method} {request.url.copy_remove_param('api_key')}")
+        # Once All Recorded Responses Are Used Up, The Last One Keeps Being Served
+        cursor = CassetteManager._cursors.get(key, 0)
+        CassetteManager._cursors[key] = cursor + 1
+        entry = entries[min(cursor, len(entries) - 1)]
+        return Response(entry["status_code"], headers=entry["headers"], content=entry["content"], request=request)
+
+    @staticmethod
+    def Save():
+        if EM.HTTP_CASSETTE == "record":
+            cassette = {"recorded_at": CassetteManager._recorded_at, "entries": CassetteManager._entries}
+            FM.CacheBinary(CassetteManager._CASSETTE_FILE, cassette, assets=True, compressed=True)
+            DBM.g(f"HTTP Cassette Saved With {len(CassetteManager._entries)} Requests.")
+
+
+class RecordingTransport(AsyncBaseTransport):
+    def __init__(self, transport: AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: Request) -> Response:
+        response = await self._transport.handle_async_request(request)
+        content = await response.aread()
+        CassetteManager.Record(request, response.status_code, response.headers, content)
+        headers = {name: value for name, value in response.headers.items() if name.lower() not in CassetteManager._DROPPED_HEADERS}
+        return Response(response.status_code, headers=headers, content=content, request=request)
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+class ReplayTransport(AsyncBaseTransport):
+    async def handle_async_request(self, request: Request) -> Response:
+        return CassetteManager.Replay(request)
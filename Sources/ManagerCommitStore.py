@@ -0,0 +1,109 @@
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from ManagerDebug import DebugManager as DBM
+from ManagerEnvironment import EnvironmentManager as EM
+from ManagerFile import FileManager as FM
+from ManagerScope import ScopeManager
+
+
+class CommitStoreManager(metaclass=ScopeManager):
+    _STORE_FILE = "commit_store.pick"
+    _STORE_VERSION = 3
+    _SCOPED = ("_user_id", "_branches", "_touched", "_fetched")
+
+    _user_id: Optional[str] = None
+    # Branch Key -> {"head": Oid Of The Branch Tip, "commits": Oid -> (Committed Date, Additions, Deletions)}
+    _branches: Dict[str, Dict] = {}
+    _touched: Set[str] = set()
+    # Branch Key -> Oids Added During This Run, Until The Branch Is Finished
+    _fetched: Dict[str, Set[str]] = {}
+
+    @staticmethod
+    def _key(owner: str, name: str, branch: str) -> str:
+        return f"{owner}/{name}:{branch}"
+
+    @staticmethod
+    def Load(user_id: str):
+        # Refresh Cycles Of The Service Mode Keep Using The Store Left In Memory By The Previous Cycle
+        warm = EM.COMMIT_CACHE and CommitStoreManager._user_id == user_id
+        CommitStoreManager._user_id = user_id
+        CommitStoreManager._touched = set()
+        CommitStoreManager._fetched = dict()
+        if warm:
+            DBM.g(f"\tCommit Store Kept In Memory With {len(CommitStoreManager._branches)} Branches.")
+            return
+        CommitStoreManager._branches = {}
+        if not EM.COMMIT_CACHE:
+            return
+
+        store = FM.CacheBinary(CommitStoreManager._STORE_FILE, store=True, user=True)
+        if not isinstance(store, Dict) or store.get("version") != CommitStoreManager._STORE_VERSION or store.get("user") != user_id:
+            DBM.w("\tNo Usable Commit Store Found, Fetching Full History.")
+            return
+        CommitStoreManager._branches = store["branches"]
+        DBM.g(f"\tCommit Store Loaded With {len(CommitStoreManager._branches)} Branches.")
+
+    @staticmethod
+    def Save():
+        if not EM.COMMIT_CACHE:
+            return
+        # Only Branches Seen During This Run Are Kept, So Deleted Branches Drop Out Of The Store
+        branches = {key: CommitStoreManager._branches[key] for key in CommitStoreManager._touched if key in CommitStoreManager._branches}
+        CommitStoreManager._branches = branches
+        store = {"version": CommitStoreManager._STORE_VERSION, "user": CommitStoreManager._user_id, "branches": branches}
+        FM.CacheBinary(CommitStoreManager._STORE_FILE, store, store=True, user=True)
+        DBM.g(f"\tCommit Store Saved With {len(branches)} Branches.")
+
+    # A Branch Deleted Since The Last Run May Have Been Merged, Its Commits Then Sort Behind The Known History Of The
+    # Remaining Branches And Pagination Would Stop Before Them, So A Repository Whose Branches Shrank Is Walked Again
+    @staticmethod
+    def ForgetDeletedBranches(owner: str, name: str, branches: Iterable[str]):
+        stored = [key for key in CommitStoreManager._branches if key.startswith(f"{owner}/{name}:")]
+        current = {CommitStoreManager._key(owner, name, branch) for branch in branches}
+        if all(key in current for key in stored):
+            return
+        DBM.i(f"\t\tBranches Of {owner}/{name} Were Deleted, Fetching Its Full History.")
+        for key in stored:
+            del CommitStoreManager._branches[key]
+
+    @staticmethod
+    def GetHead(owner: str, name: str, branch: str) -> Optional[str]:
+        entry = CommitStoreManager._branches.get(CommitStoreManager._key(owner, name, branch))
+        return entry["head"] if entry else None
+
+    @staticmethod
+    def Contains(owner: str, name: str, branch: str, oid: str) -> bool:
+        entry = CommitStoreManager._branches.get(CommitStoreManager._key(owner, name, branch))
+        return entry is not None and oid in entry["commits"]
+
+    # Writes A Fetched Commit Into The Stored History Of A Branch By Oid, Wherever It Sits In It, So Older Commits
+    # Merged In Later Are Kept. Only The Columns Needed To Count It Again Are Stored.
+    @staticmethod
+    def Add(owner: str, name: str, branch: str, commit: Dict):
+        if not EM.COMMIT_CACHE:
+            return
+        key = CommitStoreManager._key(owner, name, branch)
+        entry = CommitStoreManager._branches.setdefault(key, {"head": None, "commits": dict()})
+        entry["commits"][commit["oid"]] = (commit["committedDate"], commit["additions"], commit["deletions"])
+        CommitStoreManager._fetched.setdefault(key, set()).add(commit["oid"])
+
+    # Called Once The Last Page Of A Branch Was Added, Returns Its Whole Stored History As (Oid, (Date, Additions, Deletions)).
+    # `reached` Is The Oldest Commit Date Of The Page Pagination Stopped At Known History On, Stored Commits Not Fetched
+    # Again Are Only Kept Behind It. Without It, Pagination Ran To The End And Only Commits Added During This Run Are Kept.
+    # `head` Is The Oid Of The Branch Tip, Which May Have Been Counted On Another Branch.
+    @staticmethod
+    def Finish(owner: str, name: str, branch: str, head: Optional[str], reached: Optional[str]) -> Iterable[Tuple[str, Tuple[str, int, int]]]:
+        key = CommitStoreManager._key(owner, name, branch)
+        CommitStoreManager._touched.add(key)
+        fetched = CommitStoreManager._fetched.pop(key, set())
+        entry = CommitStoreManager._branches.get(key)
+
+        stored = entry is not None and entry["head"] is not None
+        DBM.Count("cache_lookups", cache="commit_store", result="hit" if stored and reached is not None else "miss")
+        if entry is None or head is None:
+            CommitStoreManager._branches.pop(key, None)
+            return []
+        commits = entry["commits"].items()
+        entry["commits"] = {oid: commit for oid, commit in commits if oid in fetched or (reached is not None and commit[0] <= reached)}
+        entry["head"] = head
+        return entry["commits"].items()
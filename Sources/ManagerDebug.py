@@ -1,18 +1,24 @@
+from contextlib import contextmanager
 from datetime import datetime
-from logging import getLogger, Logger, StreamHandler
+from json import dumps
+from logging import getLogger, Logger, StreamHandler, DEBUG, ERROR, INFO, WARNING
+from os import environ, makedirs
+from os.path import join
 from string import Template
-from typing import Dict
+from time import perf_counter
+from typing import Dict, Iterator, Tuple
 
 from humanize import precisedelta
 
 from ManagerEnvironment import EnvironmentManager as EM
+from ManagerScope import ScopeManager
 
 
 def InitDebugManager():
     DebugManager.CreateLogger("DEBUG" if EM.DEBUG_LOGGING else "ERROR")
 
 
-class DebugManager:
+class DebugManager(metaclass=ScopeManager):
     _COLOR_RESET = "\u001b[0m"
     _COLOR_RED = "\u001b[31m"
     _COLOR_GREEN = "\u001b[32m"
@@ -23,6 +29,17 @@ class DebugManager:
     _TIME_TEMPLATE = "time"
 
     _logger: Logger
+    _SCOPED = ("_label",)
+    # Prefixed To Every Message, So Interleaved Logs Of Batch Users Can Be Told Apart
+    _label = ""
+
+    _METRICS_PREFIX = "wakatime_stats"
+    # Span Name -> [Times Entered, Total Seconds]; Concurrent Spans Of The Same Name Add Up
+    _spans: Dict[str, list] = {}
+    # (Metric Name, Sorted Label Pairs) -> Value
+    _counters: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+    # Same Keys As The Counters, But Only The Last Value Is Kept
+    _gauges: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
 
     @staticmethod
     def CreateLogger(level: str):
@@ -38,22 +55,136 @@ class DebugManager:
             kwargs[DebugManager._TIME_TEMPLATE] = precisedelta(kwargs[DebugManager._TIME_TEMPLATE], minimum_unit="microseconds")
         return Template(message).substitute(kwargs).title()
 
+    # Messages Below The Logger Level Are Dropped Before Any Template Substitution Or Formatting
+    @staticmethod
+    def _log(level: int, color: str, message: str, kwargs: Dict):
+        if not DebugManager._logger.isEnabledFor(level):
+            return
+        message = DebugManager._label + DebugManager._process_template(message, kwargs)
+        DebugManager._logger.log(level, f"{color}{message}{DebugManager._COLOR_RESET}")
+
     @staticmethod
     def g(message: str, **kwargs):
-        message = DebugManager._process_template(message, kwargs)
-        DebugManager._logger.info(f"{DebugManager._COLOR_GREEN}{message}{DebugManager._COLOR_RESET}")
+        DebugManager._log(INFO, DebugManager._COLOR_GREEN, message, kwargs)
 
     @staticmethod
     def i(message: str, **kwargs):
-        message = DebugManager._process_template(message, kwargs)
-        DebugManager._logger.debug(f"{DebugManager._COLOR_BLUE}{message}{DebugManager._COLOR_RESET}")
+        DebugManager._log(DEBUG, DebugManager._COLOR_BLUE, message, kwargs)
 
     @staticmethod
     def w(message: str, **kwargs):
-        message = DebugManager._process_template(message, kwargs)
-        DebugManager._logger.warning(f"{DebugManager._COLOR_YELLOW}{message}{DebugManager._COLOR_RESET}")
+        DebugManager._log(WARNING, DebugManager._COLOR_YELLOW, message, kwargs)
 
     @staticmethod
     def p(message: str, **kwargs):
-        message = DebugManager._process_template(message, kwargs)
-        DebugManager._logger.error(f"{DebugManager._COLOR_RED}{message}{DebugManager._COLOR_RESET}")
+        DebugManager._log(ERROR, DebugManager._COLOR_RED, message, kwargs)
+
+    # Times The Enclosed Block, Works Around Both Blocking And Awaited Code
+    @staticmethod
+    @contextmanager
+    def Span(name: str) -> Iterator[None]:
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            span = DebugManager._spans.setdefault(name, [0, 0.0])
+            span[0] += 1
+            span[1] += perf_counter() - started
+
+    @staticmethod
+    def Count(metric: str, value: float = 1, **labels: str):
+        key = (metric, tuple(sorted(labels.items())))
+        DebugManager._counters[key] = DebugManager._counters.get(key, 0) + value
+
+    @staticmethod
+    def Gauge(metric: str, value: float, **labels: str):
+        DebugManager._gauges[(metric, tuple(sorted(labels.items())))] = value
+
+    @staticmethod
+    def _cache_ratios() -> Dict[str, Dict]:
+        caches = dict()
+        for (metric, labels), value in DebugManager._counters.items():
+            if metric == "cache_lookups":
+                labels = dict(labels)
+                cache = caches.setdefault(labels["cache"], {"hits": 0, "misses": 0})
+                # Revalidated And Stale Copies Still Spare A Full Download, So Only Misses Count Against The Ratio
+                cache["misses" if labels["result"] == "miss" else "hits"] += value
+        for cache in caches.values():
+            cache["hit_ratio"] = cache["hits"] / max(cache["hits"] + cache["misses"], 1)
+        return caches
+
+    @staticmethod
+    def _report_json() -> str:
+        counters = dict()
+        for (metric, labels), value in sorted(DebugManager._counters.items()):
+            counters.setdefault(metric, []).append({"labels": dict(labels), "value": value})
+        gauges = dict()
+        for (metric, labels), value in sorted(DebugManager._gauges.items()):
+            gauges.setdefault(metric, []).append({"labels": dict(labels), "value": value})
+        spans = {name: {"count": count, "seconds": seconds} for name, (count, seconds) in DebugManager._spans.items()}
+        return dumps({"spans": spans, "counters": counters, "gauges": gauges, "caches": DebugManager._cache_ratios()}, indent=2)
+
+    @staticmethod
+    def _report_openmetrics() -> str:
+        prefix = DebugManager._METRICS_PREFIX
+        lines = [f"# TYPE {prefix}_span_seconds counter", f"# UNIT {prefix}_span_seconds seconds"]
+        for name, (count, seconds) in DebugManager._spans.items():
+            lines.append(f'{prefix}_span_seconds_total{{span="{name}"}} {seconds:.6f}')
+        lines.append(f"# TYPE {prefix}_span_calls counter")
+        for name, (count, seconds) in DebugManager._spans.items():
+            lines.append(f'{prefix}_span_calls_total{{span="{name}"}} {count}')
+
+        typed = set()
+        for (metric, labels), value in sorted(DebugManager._counters.items()):
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f"# TYPE {prefix}_{metric} counter")
+            rendered = ",".join(f'{label}="{text}"' for label, text in labels)
+            lines.append(f"{prefix}_{metric}_total{{{rendered}}} {value:g}")
+        for (metric, labels), value in sorted(DebugManager._gauges.items()):
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f"# TYPE {prefix}_{metric} gauge")
+            rendered = ",".join(f'{label}="{text}"' for label, text in labels)
+            lines.append(f"{prefix}_{metric}{{{rendered}}} {value:g}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _report_markdown() -> str:
+        lines = ["### WakaTime Stats Run", "", "| Stage | Calls | Seconds |", "| --- | ---: | ---: |"]
+        for name, (count, seconds) in DebugManager._spans.items():
+            lines.append(f"| {name} | {count} | {seconds:.2f} |")
+        requests = [(dict(labels), value) for (metric, labels), value in DebugManager._counters.items() if metric == "http_requests"]
+        if requests:
+            lines += ["", "| Host | Requests |", "| --- | ---: |"]
+            lines += [f"| {labels.get('host', '')} | {value:g} |" for labels, value in requests]
+        pools = dict()
+        for (metric, labels), value in DebugManager._gauges.items():
+            if metric == "http_pool_connections":
+                labels = dict(labels)
+                pools.setdefault(labels["host"], {})[labels["state"]] = value
+        if pools:
+            lines += ["", "| Connection Pool | Open | Idle | HTTP/2 |", "| --- | ---: | ---: | ---: |"]
+            lines += [f"| {host} | {pool.get('open', 0):g} | {pool.get('idle', 0):g} | {pool.get('http2', 0):g} |" for host, pool in pools.items()]
+        caches = DebugManager._cache_ratios()
+        if caches:
+            lines += ["", "| Cache | Hits | Misses | Hit Ratio |", "| --- | ---: | ---: | ---: |"]
+            lines += [f"| {name} | {cache['hits']:g} | {cache['misses']:g} | {cache['hit_ratio']:.0%} |" for name, cache in caches.items()]
+        return "\n".join(lines) + "\n"
+
+    # Writes The Collected Spans And Counters As JSON And OpenMetrics Text, And Optionally To The Job Summary
+    @staticmethod
+    def Report():
+        for name, (count, seconds) in DebugManager._spans.items():
+            DebugManager.i(f"\tStage {name} : {seconds:.3f}s Over {count} Call(s).")
+        if EM.METRICS_PATH:
+            makedirs(EM.METRICS_PATH, exist_ok=True)
+            with open(join(EM.METRICS_PATH, "metrics.json"), "w") as file:
+                file.write(DebugManager._report_json())
+            with open(join(EM.METRICS_PATH, "metrics.prom"), "w") as file:
+                file.write(DebugManager._report_openmetrics())
+            DebugManager.g("Run Metrics Written.")
+        if EM.METRICS_STEP_SUMMARY and "GITHUB_STEP_SUMMARY" in environ:
+            with open(environ["GITHUB_STEP_SUMMARY"], "a") as file:
+                file.write(DebugManager._report_markdown())
@@ -1,14 +1,40 @@
-from asyncio import Task
+from asyncio import FIRST_COMPLETED, CancelledError, Future, Task, create_task, gather, get_running_loop, shield, wait
+from collections import deque
+from datetime import date
 from hashlib import md5
+from importlib.util import find_spec
 from json import dumps
 from string import Template
-from typing import Awaitable, Dict, Callable, Optional, List, Tuple, Union
+from time import monotonic
+from typing import AsyncIterator, Awaitable, Dict, Callable, Optional, List, Tuple, Union
 
-from httpx import AsyncClient, Response
-from yaml import safe_load
+from httpx import AsyncClient, AsyncHTTPTransport, Limits, Response
+from yaml import load
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 from ManagerEnvironment import EnvironmentManager as EM
+from ManagerCassette import CassetteManager as CSTM
 from ManagerDebug import DebugManager as DBM
+from ManagerFile import FileManager as FM
+from ManagerHttpCache import HttpCacheManager as HCM
+from ManagerRateLimit import RateLimitManager as RLM
+from ManagerRequest import RequestManager as RQM
+from ManagerScope import ScopeManager
+
+GITHUB_API = "https://api.github.com"
+
+# URL Pattern -> Connection Pool; Every Host Group Keeps Its Own Connections, So Slow Static Downloads Never Queue GitHub API Calls.
+# The GitHub API Multiplexes All Concurrent Requests Over HTTP/2 When The Optional `h2` Package Is Installed.
+_POOL_LIMITS = Limits(max_connections=EM.HTTP_MAX_CONNECTIONS, max_keepalive_connections=EM.HTTP_MAX_CONNECTIONS, keepalive_expiry=EM.HTTP_KEEPALIVE_EXPIRY)
+HTTP_POOLS: Dict[str, AsyncHTTPTransport] = {
+    GITHUB_API: AsyncHTTPTransport(http2=EM.HTTP2 and find_spec("h2") is not None, limits=_POOL_LIMITS),
+    "https://wakatime.com": AsyncHTTPTransport(limits=_POOL_LIMITS),
+    "all://": AsyncHTTPTransport(limits=_POOL_LIMITS),
+}
 
 # GitHub GraphQL API Query Templates
 GITHUB_API_QUERIES = {
@@ -96,41 +122,138 @@ GITHUB_API_QUERIES = {
 }
 
 
-async def InitDownloadManager(user_login: str):
-    await DownloadManager.LoadRemoteResources(
-        linguist="https://cdn.jsdelivr.net/gh/github/linguist@master/lib/linguist/languages.yml",
-        waka_latest=f"https://wakatime.com/api/v1/users/current/stats/last_7_days?api_key={EM.WAKATIME_API_KEY}",
-        waka_all=f"https://wakatime.com/api/v1/users/current/all_time_since_today?api_key={EM.WAKATIME_API_KEY}",
-        github_stats=f"https://github-contributions.vercel.app/api/v1/{user_login}",
-    )
+# GitHub REST Resources Are Loaded Alongside The Others, `readme_ref` Is Only Given When The README Gets Published
+async def InitDownloadManager(user_login: str, repository: str, readme_ref: Optional[str] = None):
+    DownloadManager.ResetRemoteResources()
+    # Only Resources Used By An Enabled Section Are Requested
+    resources = dict()
+    if readme_ref is not None:
+        resources["github_readme"] = f"{GITHUB_API}/repos/{repository}/readme?ref={readme_ref}"
+    if EM.SHOW_PROFILE_VIEWS:
+        resources["github_views"] = f"{GITHUB_API}/repos/{repository}/traffic/views?per=week"
+    if EM.SHOW_LOC_CHART:
+        resources["linguist"] = "https://cdn.jsdelivr.net/gh/github/linguist@master/lib/linguist/languages.yml"
+    if EM.ShowTotalCodeTime():
+        resources["waka_all"] = f"https://wakatime.com/api/v1/users/current/all_time_since_today?api_key={EM.WAKATIME_API_KEY}"
+    if EM.SHOW_SHORT_INFO:
+        resources["github_stats"] = f"https://github-contributions.vercel.app/api/v1/{user_login}"
+    await DownloadManager.LoadRemoteResources(**resources)
+
 
+class DownloadManager(metaclass=ScopeManager):
+    _SCOPED = ("_REMOTE_RESOURCES_CACHE",)
 
-class DownloadManager:
-    _client = AsyncClient(timeout=60.0)
+    # The Client, Its Connection Pool And The Resources Below Are Shared By All Users Of A Batch
+    # While Recording Or Replaying, The Cassette Transport Handles Every Request Instead Of The Pools
+    _client = AsyncClient(timeout=60.0, transport=CSTM.Transport()) if EM.HTTP_CASSETTE else AsyncClient(timeout=60.0, mounts=HTTP_POOLS)
     _REMOTE_RESOURCES_CACHE: Dict[str, Union[Awaitable, Response]] = {}
+    _SHARED_RESOURCES = {"linguist"}
+    _SHARED_RESOURCES_CACHE: Dict[str, Union[Awaitable, Response]] = {}
+    # Shared Resources Are Requested Again By The Service Mode Once This Is Older Than `HTTP_CACHE_MAX_AGE`
+    _shared_requested_at = 0.0
+    # Max Age In Seconds Of The On-Disk Copy Of Each Static Resource, Resources Not Listed Are Never Cached
+    _HTTP_CACHE_POLICIES: Dict[str, float] = {"linguist": EM.HTTP_CACHE_MAX_AGE, "github_stats": 0}
+
+    # Query -> (First Page Size, Max Page Size); GraphQL Charges Roughly One Point Per 100 Requested Nodes
+    _GRAPHQL_PAGE_SIZES: Dict[str, Tuple[int, int]] = {
+        "user_repository_list": (100, 100),
+        "repos_contributed_to": (100, 100),
+        "repo_branch_list": (20, 100),
+        "repo_commit_list": (50, 100),
+    }
+    _LANGUAGE_COLORS_FILE = "linguist_colors.pick"
+    _language_colors: Optional[Dict[str, str]] = None
+
+    @staticmethod
+    def _resources_cache(key: str) -> Dict[str, Union[Awaitable, Response]]:
+        return DownloadManager._SHARED_RESOURCES_CACHE if key in DownloadManager._SHARED_RESOURCES else DownloadManager._REMOTE_RESOURCES_CACHE
 
+    # Starts Every Download As A Concurrent Task, Consumers Await Them Lazily In `_get_remote_resource`.
+    # Shared Resources Are Only Downloaded By The First Batch User Asking For Them.
     @staticmethod
     async def LoadRemoteResources(**resources: str):
         for key, url in resources.items():
-            DownloadManager._REMOTE_RESOURCES_CACHE[key] = await DownloadManager._client.get(url)
+            cache = DownloadManager._resources_cache(key)
+            if key not in cache or key not in DownloadManager._SHARED_RESOURCES:
+                cache[key] = create_task(DownloadManager._download_resource(key, url))
+                if key in DownloadManager._SHARED_RESOURCES:
+                    DownloadManager._shared_requested_at = monotonic()
 
     @staticmethod
-    async def CloseRemoteResources():
+    def _github_headers() -> Dict[str, str]:
+        return {"Authorization": f"Bearer {EM.GH_TOKEN}", "Accept": "application/vnd.github+json"}
+
+    @staticmethod
+    async def _download_resource(key: str, url: str) -> Response:
+        token = DownloadManager._github_headers() if url.startswith(GITHUB_API) else dict()
+
+        async def Fetch(headers: Dict[str, str]) -> Response:
+            return await RQM.Execute(key, lambda timeout: DownloadManager._client.get(url, headers=headers | token, timeout=timeout))
+
+        with DBM.Span(f"Download {key}"):
+            max_age = DownloadManager._HTTP_CACHE_POLICIES.get(key)
+            if max_age is None:
+                return await Fetch(dict())
+            return await HCM.Get(url, max_age, Fetch)
+
+    # Drops Downloads Of The Current User That No Section Awaited
+    @staticmethod
+    def CancelRemoteResources():
         for resource in DownloadManager._REMOTE_RESOURCES_CACHE.values():
             if isinstance(resource, Task):
                 resource.cancel()
             elif isinstance(resource, Awaitable):
                 pass
+
+    # Forgets The Downloads And GraphQL Results Of The Current User, Left Over From A Previous Refresh Cycle
+    @staticmethod
+    def ResetRemoteResources():
+        DownloadManager.CancelRemoteResources()
+        DownloadManager._REMOTE_RESOURCES_CACHE.clear()
+
+    # Called Between Refresh Cycles, While No User Is Waiting For A Shared Resource
+    @staticmethod
+    def ExpireSharedResources():
+        if monotonic() - DownloadManager._shared_requested_at >= EM.HTTP_CACHE_MAX_AGE:
+            DownloadManager._SHARED_RESOURCES_CACHE.clear()
+            DownloadManager._language_colors = None
+
+    # Snapshot Of Each Connection Pool For The Debug Output, Idle Connections Are Kept Open For Reuse Until They Expire
+    @staticmethod
+    def RecordPoolStats():
+        for pattern, transport in HTTP_POOLS.items():
+            pool, host = getattr(transport, "_pool", None), pattern.partition("://")[2] or "other"
+            connections = list(getattr(pool, "connections", []))
+            idle = sum(1 for connection in connections if connection.is_idle())
+            # Connection Info Reads Like "'https://api.github.com:443', HTTP/2, ACTIVE, Request Count: 3"
+            multiplexed = sum(1 for connection in connections if ", HTTP/2," in connection.info())
+            DBM.Gauge("http_pool_connections", len(connections), host=host, state="open")
+            DBM.Gauge("http_pool_connections", idle, host=host, state="idle")
+            DBM.Gauge("http_pool_connections", multiplexed, host=host, state="http2")
+            DBM.i(f"\tConnection Pool {host} : {len(connections)} Open, {idle} Idle, {multiplexed} HTTP/2.")
+
+    @staticmethod
+    async def CloseRemoteResources():
+        DownloadManager.CancelRemoteResources()
+        DownloadManager.RecordPoolStats()
+        for resource in DownloadManager._SHARED_RESOURCES_CACHE.values():
+            if isinstance(resource, Task):
+                resource.cancel()
         await DownloadManager._client.aclose()
+        CSTM.Save()
 
     @staticmethod
     async def _get_remote_resource(resource: str, convertor: Optional[Callable[[bytes], Dict]]) -> Optional[Dict]:
         DBM.i(f"\tRequesting Static Resource '{resource}'...")
-        entry = DownloadManager._REMOTE_RESOURCES_CACHE[resource]
+        cache = DownloadManager._resources_cache(resource)
+        entry = cache.get(resource)
+        if entry is None:
+            DBM.w(f"\tStatic Resource '{resource}' Was Not Requested By Any Enabled Section.")
+            return None
 
         if isinstance(entry, Awaitable):
             res = await entry
-            DownloadManager._REMOTE_RESOURCES_CACHE[resource] = res
+            cache[resource] = res
             DBM.g(f"\tStatic Resource '{resource}' Downloaded And Cached.")
         else:
             res = entry
@@ -141,7 +264,7 @@ class DownloadManager:
         elif res.status_code in {201, 202}:
             DBM.w(f"\tStatic Resource '{resource}' Returned Status {res.status_code}.")
             return None
-        raise Exception(f"Static Request To '{res.url}' Failed With Code {res.status_code}: {res.json()}")
+        raise Exception(f"Static Request To '{res.url}' Failed With Code {res.status_code}: {res.text}")
 
     @staticmethod
     async def GetRemoteJson(resource: str) -> Optional[Dict]:
@@ -149,23 +272,77 @@ class DownloadManager:
 
     @staticmethod
     async def GetRemoteYaml(resource: str) -> Optional[Dict]:
-        return await DownloadManager._get_remote_resource(resource, safe_load)
+        return await DownloadManager._get_remote_resource(resource, lambda content: load(content, Loader=SafeLoader))
+
+    # GitHub REST Request Awaited Right Away, For Data Later Requests Depend On (E.g. The User's Login)
+    @staticmethod
+    async def GetRemoteRest(path: str) -> Dict:
+        url = f"{GITHUB_API}/{path}"
+        res = await RQM.Execute(path, lambda timeout: DownloadManager._client.get(url, headers=DownloadManager._github_headers(), timeout=timeout))
+        if res.status_code == 200:
+            return res.json()
+        raise Exception(f"GitHub REST Request '{path}' Failed With Code {res.status_code}: {res.text}")
+
+    # Daily WakaTime Summaries From `start` To `end` (Both Included), None If The Range Can't Be Fetched
+    @staticmethod
+    async def GetRemoteWakaTimeSummaries(start: date, end: date) -> Optional[List[Dict]]:
+        url = f"https://wakatime.com/api/v1/users/current/summaries?start={start}&end={end}&api_key={EM.WAKATIME_API_KEY}"
+        with DBM.Span("WakaTime Summaries"):
+            res = await RQM.Execute(f"waka_summaries {start}", lambda timeout: DownloadManager._client.get(url, timeout=timeout))
+        if res.status_code == 200:
+            return res.json()["data"]
+        DBM.w(f"\tWakaTime Summaries From {start} To {end} Returned Status {res.status_code}.")
+        return None
 
     @staticmethod
-    async def _fetch_graphql_query(query: str, retries_count: int = 10, **kwargs) -> Dict:
+    def _build_language_colors(content: bytes) -> Dict[str, str]:
+        digest = md5(content).hexdigest()
+        index = FM.CacheBinary(DownloadManager._LANGUAGE_COLORS_FILE, store=True)
+        if isinstance(index, Dict) and index.get("hash") == digest:
+            DBM.Count("cache_lookups", cache="language_colors", result="hit")
+            DBM.g("\tLanguage Colors Loaded From Index.")
+            return index["colors"]
+        DBM.Count("cache_lookups", cache="language_colors", result="miss")
+
+        # Languages Are Also Indexed By Lowercase Name And Alias So Lookups Match Linguist's Own Rules
+        colors = dict()
+        for name, details in (load(content, Loader=SafeLoader) or {}).items():
+            if "color" not in details:
+                continue
+            for key in [name, name.lower()] + details.get("aliases", []):
+                colors.setdefault(key, details["color"])
+        FM.CacheBinary(DownloadManager._LANGUAGE_COLORS_FILE, {"hash": digest, "colors": colors}, store=True)
+        DBM.g("\tLanguage Colors Index Rebuilt.")
+        return colors
+
+    @staticmethod
+    async def GetLanguageColors() -> Dict[str, str]:
+        if DownloadManager._language_colors is None:
+            DownloadManager._language_colors = await DownloadManager._get_remote_resource("linguist", DownloadManager._build_language_colors) or {}
+        return DownloadManager._language_colors
+
+    @staticmethod
+    async def _fetch_graphql_document(name: str, document: str) -> Dict:
         headers = {"Authorization": f"Bearer {EM.GH_TOKEN}"}
-        query_template = Template(GITHUB_API_QUERIES[query])
-        res = await DownloadManager._client.post(
-            "https://api.github.com/graphql",
-            json={"query": query_template.substitute(kwargs)},
-            headers=headers,
-        )
+        # Every Query Also Reports Its Point Cost, Mutations Can't Select Fields Of The Query Root
+        if not document.lstrip().startswith("mutation"):
+            document = f"{document.rstrip()[:-1]}    rateLimit {{ cost remaining resetAt }}\n}}"
+
+        async def Send(timeout: float) -> Response:
+            return await DownloadManager._client.post(f"{GITHUB_API}/graphql", json={"query": document}, headers=headers, timeout=timeout)
 
+        res = await RQM.Execute(name, Send, RQM.ClassifyGraphqlResponse, resource="graphql")
         if res.status_code == 200:
-            return res.json()
-        elif res.status_code == 502 and retries_count > 0:
-            return await DownloadManager._fetch_graphql_query(query, retries_count - 1, **kwargs)
-        raise Exception(f"GraphQL Query '{query}' Failed With Code {res.status_code}: {res.json()}")
+            body = res.json()
+            RLM.RecordGraphqlCost((body.get("data") or {}).pop("rateLimit", None))
+            return body
+        raise Exception(f"GraphQL Query '{name}' Failed With Code {res.status_code}: {res.text}")
+
+    @staticmethod
+    async def _fetch_graphql_query(query: str, **kwargs) -> Dict:
+        query_template = Template(GITHUB_API_QUERIES[query])
+        with DBM.Span(f"GraphQL {query}"):
+            return await DownloadManager._fetch_graphql_document(query, query_template.substitute(kwargs))
 
     @staticmethod
     def _find_pagination_and_data_list(response: Dict) -> Tuple[List, Dict]:
@@ -175,28 +352,168 @@ class DownloadManager:
             return DownloadManager._find_pagination_and_data_list(next(iter(response.values())))
         return [], {"hasNextPage": False}
 
+    @staticmethod
+    def _pagination(size: int, cursor: Optional[str]) -> str:
+        return f"first: {size}" if cursor is None else f'first: {size}, after: "{cursor}"'
+
+    @staticmethod
+    def _next_page_size(query: str, size: int) -> int:
+        # Pages Grow Geometrically, So Short Lists Stay Cheap While Long Ones Quickly Reach Full Pages
+        return min(size * 2, DownloadManager._GRAPHQL_PAGE_SIZES.get(query, (100, 100))[1])
+
     @staticmethod
     async def _fetch_graphql_paginated(query: str, **kwargs) -> List:
         results = []
-        pagination = "first: 100"
+        size, cursor = DownloadManager._GRAPHQL_PAGE_SIZES.get(query, (100, 100))[0], None
         while True:
-            response = await DownloadManager._fetch_graphql_query(query, **kwargs, pagination=pagination)
+            response = await DownloadManager._fetch_graphql_query(query, **kwargs, pagination=DownloadManager._pagination(size, cursor))
             page, info = DownloadManager._find_pagination_and_data_list(response)
             results.extend(page)
             if not info.get("hasNextPage"):
                 break
-            pagination = f'first: 100, after: "{info["endCursor"]}"'
+            size, cursor = DownloadManager._next_page_size(query, size), info["endCursor"]
         return results
 
+    @staticmethod
+    def _graphql_cache_key(query: str, kwargs: Dict) -> str:
+        return f"{query}_{md5(dumps(kwargs, sort_keys=True).encode('utf-8')).digest()}"
+
+    @staticmethod
+    def _graphql_lookup(entry: Optional[Union[Future, Dict, List]]) -> str:
+        return "miss" if entry is None else "coalesced" if isinstance(entry, Future) else "hit"
+
+    # Results Still In Flight Are Cached As Futures; Every Caller Awaits The Same One, Failed Requests Are Forgotten
+    @staticmethod
+    async def _await_graphql(key: str, entry: Union[Future, Dict, List]) -> Union[Dict, List]:
+        if not isinstance(entry, Future):
+            return entry
+        try:
+            # Shielded, So One Cancelled Caller Doesn't Cancel The Request Others Are Waiting For
+            result = await shield(entry)
+        except Exception:
+            if DownloadManager._REMOTE_RESOURCES_CACHE.get(key) is entry:
+                del DownloadManager._REMOTE_RESOURCES_CACHE[key]
+            raise
+        DownloadManager._REMOTE_RESOURCES_CACHE[key] = result
+        return result
+
+    @staticmethod
+    async def _fetch_graphql(query: str, **kwargs) -> Union[Dict, List]:
+        if "$pagination" in GITHUB_API_QUERIES[query]:
+            return await DownloadManager._fetch_graphql_paginated(query, **kwargs)
+        return await DownloadManager._fetch_graphql_query(query, **kwargs)
+
+    # Concurrent Calls With The Same Query And Arguments Share One In-Flight Request, Which Fetches Every Page.
+    # Callers Wanting To Stop Early Use `StreamRemoteGraphqlBatch`, Whose Pages Aren't Cached
     @staticmethod
     async def GetRemoteGraphql(query: str, **kwargs) -> Dict:
-        key = f"{query}_{md5(dumps(kwargs, sort_keys=True).encode('utf-8')).digest()}"
-        if key not in DownloadManager._REMOTE_RESOURCES_CACHE:
-            requires_pagination = "$pagination" in GITHUB_API_QUERIES[query]
-            result = (
-                await DownloadManager._fetch_graphql_paginated(query, **kwargs)
-                if requires_pagination
-                else await DownloadManager._fetch_graphql_query(query, **kwargs)
-            )
-            DownloadManager._REMOTE_RESOURCES_CACHE[key] = result
-        return DownloadManager._REMOTE_RESOURCES_CACHE[key]
+        key = DownloadManager._graphql_cache_key(query, kwargs)
+        entry = DownloadManager._REMOTE_RESOURCES_CACHE.get(key)
+        DBM.Count("cache_lookups", cache="graphql", result=DownloadManager._graphql_lookup(entry))
+        if entry is None:
+            entry = DownloadManager._REMOTE_RESOURCES_CACHE[key] = create_task(DownloadManager._fetch_graphql(query, **kwargs))
+        return await DownloadManager._await_graphql(key, entry)
+
+    @staticmethod
+    async def _fetch_graphql_batch(query: str, batch: List[Dict]) -> List[Dict]:
+        # Strip The Outer Braces Of The Query Template So Each Item Becomes An Aliased Top-Level Field
+        body = GITHUB_API_QUERIES[query].strip()[1:-1].strip()
+        fields = []
+        for alias, state in enumerate(batch):
+            pagination = DownloadManager._pagination(state["size"], state["cursor"])
+            fields.append(f"r{alias}: {Template(body).substitute(state['kwargs'], pagination=pagination)}")
+        with DBM.Span(f"GraphQL {query}"):
+            response = await DownloadManager._fetch_graphql_document(f"{query} x{len(batch)}", "{\n" + "\n".join(fields) + "\n}")
+
+        data = response.get("data") or {}
+        for alias, state in enumerate(batch):
+            field = data.get(f"r{alias}")
+            page, info = DownloadManager._find_pagination_and_data_list(field) if isinstance(field, Dict) else ([], {"hasNextPage": False})
+            stopped = state["stop"] is not None and state["stop"](state["kwargs"], page)
+            state["page"] = page
+            state["cursor"] = info.get("endCursor")
+            state["size"] = DownloadManager._next_page_size(query, state["size"])
+            state["done"] = not info.get("hasNextPage") or stopped
+        return batch
+
+    # Streams A Paginated Query For Many Items As (Item Index, Page Nodes, Is Last Page) Tuples, In Arrival Order.
+    # Up To `batch_size` Items Share One Aliased Request And Up To `workers` Requests Are In Flight; Items Go Back
+    # Into The Queue While They Still Have A Next Page. `stop` Receives The Item Kwargs And Each Page And Ends That
+    # Item's Pagination After A Page It Returns True For. Pages Are Not Cached, So Memory Stays Flat.
+    # `first_page_sizes` Lets Callers Ask For A Smaller First Page When Only A Few New Nodes Are Expected.
+    @staticmethod
+    async def StreamRemoteGraphqlBatch(
+        query: str,
+        items: List[Dict],
+        stop: Optional[Callable[[Dict, List], bool]] = None,
+        batch_size: int = 10,
+        workers: int = 1,
+        first_page_sizes: Optional[List[Optional[int]]] = None,
+    ) -> AsyncIterator[Tuple[int, List, bool]]:
+        default_size = DownloadManager._GRAPHQL_PAGE_SIZES.get(query, (100, 100))[0]
+        pending = deque()
+        for index, (kwargs, size) in enumerate(zip(items, first_page_sizes or [None] * len(items))):
+            pending.append({"index": index, "kwargs": kwargs, "stop": stop, "cursor": None, "size": size or default_size})
+        # Which Items Share A Request Depends On The Order Requests Complete In, So While Recording Or Replaying
+        # Requests Are Sent One After Another And Every Run Builds The Same Documents
+        workers = 1 if EM.HTTP_CASSETTE else max(workers, 1)
+
+        in_flight, finished = set(), set()
+        try:
+            while pending or in_flight:
+                while pending and len(in_flight) < workers:
+                    batch = [pending.popleft() for _ in range(min(batch_size, len(pending)))]
+                    in_flight.add(create_task(DownloadManager._fetch_graphql_batch(query, batch)))
+
+                finished, in_flight = await wait(in_flight, return_when=FIRST_COMPLETED)
+                while finished:
+                    for state in finished.pop().result():
+                        yield state["index"], state["page"], state["done"]
+                        if not state["done"]:
+                            pending.append(state)
+        finally:
+            # Requests Still Running Or Not Yet Looked At When One Fails Are Collected, So None Of Them Is Reported As Unretrieved
+            for task in in_flight:
+                task.cancel()
+            await gather(*in_flight, *finished, return_exceptions=True)
+
+    # Collects The Stream Into One Node List Per Item, Cached Under The Same Keys As `GetRemoteGraphql`.
+    # Items Already Being Fetched By Another Caller Are Awaited Instead Of Requested Again.
+    @staticmethod
+    async def GetRemoteGraphqlBatch(
+        query: str,
+        items: List[Dict],
+        batch_size: int = 10,
+        workers: int = 1,
+        first_page_sizes: Optional[List[Optional[int]]] = None,
+    ) -> List[List]:
+        keys = [DownloadManager._graphql_cache_key(query, kwargs) for kwargs in items]
+        entries, futures = [], dict()
+        for index, key in enumerate(keys):
+            entry = DownloadManager._REMOTE_RESOURCES_CACHE.get(key)
+            DBM.Count("cache_lookups", cache="graphql", result=DownloadManager._graphql_lookup(entry))
+            if entry is None:
+                entry = DownloadManager._REMOTE_RESOURCES_CACHE[key] = futures[index] = get_running_loop().create_future()
+            entries.append(entry)
+        missing = list(futures)
+        results = {index: [] for index in missing}
+
+        sizes = [first_page_sizes[index] for index in missing] if first_page_sizes else None
+        stream = DownloadManager.StreamRemoteGraphqlBatch(query, [items[index] for index in missing], None, batch_size, workers, sizes)
+        try:
+            async for position, page, _ in stream:
+                results[missing[position]].extend(page)
+        except BaseException as error:
+            for index, future in futures.items():
+                DownloadManager._REMOTE_RESOURCES_CACHE.pop(keys[index], None)
+                if isinstance(error, CancelledError):
+                    future.cancel()
+                else:
+                    # Marked As Retrieved, So A Future No Other Caller Awaits Isn't Logged As Unhandled
+                    future.set_exception(error)
+                    future.exception()
+            raise
+
+        for index, nodes in results.items():
+            futures[index].set_result(nodes)
+        return [await DownloadManager._await_graphql(key, entry) for key, entry in zip(keys, entries)]
@@ -1,12 +1,26 @@
 from os import getenv, environ
+from os.path import join
 
+from ManagerScope import ScopeManager
 
-class EnvironmentManager:
+
+class EnvironmentManager(metaclass=ScopeManager):
     _TRUTHY = ["true", "1", "t", "y", "yes"]
+    # Set Per User In Batch Runs
+    _SCOPED = ("GH_TOKEN", "WAKATIME_API_KEY", "REPOSITORY")
+
+    # Batch Runs Read The Users From A JSON File, Everything Else Is Shared By All Of Them
+    BATCH_FILE = getenv("INPUT_BATCH_FILE", "")
+    BATCH_WORKERS = max(int(getenv("INPUT_BATCH_WORKERS", "4")), 1)
+    # Seconds Between Refreshes When Running As A Service, Single Run If 0; Jitter Is A Fraction Of The Interval
+    REFRESH_INTERVAL = float(getenv("INPUT_REFRESH_INTERVAL", "0"))
+    REFRESH_JITTER = min(max(float(getenv("INPUT_REFRESH_JITTER", "0.1")), 0.0), 1.0)
 
-    # Required Tokens
-    GH_TOKEN = environ["INPUT_GH_TOKEN"]
-    WAKATIME_API_KEY = environ["INPUT_WAKATIME_API_KEY"]
+    # Required Tokens, Unless Given Per User By The Batch File
+    GH_TOKEN = getenv("INPUT_GH_TOKEN", "") if BATCH_FILE else environ["INPUT_GH_TOKEN"]
+    WAKATIME_API_KEY = getenv("INPUT_WAKATIME_API_KEY", "") if BATCH_FILE else environ["INPUT_WAKATIME_API_KEY"]
+    # Profile Repository The README Is Published To, "<login>/I8o8i-WakaTime-Stats" If Empty
+    REPOSITORY = getenv("GITHUB_REPOSITORY", "")
 
     # Section And Branch Configuration
     SECTION_NAME = getenv("INPUT_SECTION_NAME", "waka")
@@ -35,12 +49,53 @@ class EnvironmentManager:
     COMMIT_USERNAME = getenv("INPUT_COMMIT_USERNAME", "")
     COMMIT_EMAIL = getenv("INPUT_COMMIT_EMAIL", "")
     COMMIT_SINGLE = getenv("INPUT_COMMIT_SINGLE", "False").lower() in _TRUTHY
+    SPARSE_CLONE = getenv("INPUT_SPARSE_CLONE", "True").lower() in _TRUTHY
+    PUBLISH_MODE = getenv("INPUT_PUBLISH_MODE", "clone").lower()  # "clone" Or "api"
 
     # Miscellaneous Settings
     UPDATED_DATE_FORMAT = getenv("INPUT_UPDATED_DATE_FORMAT", "%d/%m/%Y %H:%M:%S")
     IGNORED_REPOS = getenv("INPUT_IGNORED_REPOS", "").replace(" ", "").split(",")
     SYMBOL_VERSION = int(getenv("INPUT_SYMBOL_VERSION", "1"))
+    # Periods In Days The WakaTime Activity Section Is Shown For, Computed From Daily Summaries Stored In The Assets Folder
+    WAKATIME_WINDOWS = list(dict.fromkeys(max(int(days), 1) for days in getenv("INPUT_WAKATIME_WINDOWS", "7").split(",") if days.strip())) or [7]
+    CHART_FORMAT = getenv("INPUT_CHART_FORMAT", "png").lower()  # "png" Or "svg"
+
+    # Performance Settings
+    COMMIT_CACHE = getenv("INPUT_COMMIT_CACHE", "True").lower() in _TRUTHY
+    # Relative To The Workspace Of The Job, Which Outlives The Action's Container And Can Be Kept With `actions/cache`
+    STORE_PATH = join(getenv("GITHUB_WORKSPACE", ""), getenv("INPUT_STORE_PATH", ".wakatime-stats"))
+    CRAWLER_WORKERS = max(int(getenv("INPUT_CRAWLER_WORKERS", "8")), 1)
+    RATE_LIMIT_RESERVE = int(getenv("INPUT_RATE_LIMIT_RESERVE", "100"))
+    REQUEST_TIMEOUT_BUDGET = float(getenv("INPUT_REQUEST_TIMEOUT_BUDGET", "600"))
+    HTTP_CACHE_MAX_AGE = int(getenv("INPUT_HTTP_CACHE_MAX_AGE", "86400"))
+    HTTP_MAX_CONNECTIONS = max(int(getenv("INPUT_HTTP_MAX_CONNECTIONS", "16")), 1)
+    HTTP_KEEPALIVE_EXPIRY = float(getenv("INPUT_HTTP_KEEPALIVE_EXPIRY", "30"))
+    HTTP2 = getenv("INPUT_HTTP2", "True").lower() in _TRUTHY
+    GRAPHQL_BATCH_SIZE = max(int(getenv("INPUT_GRAPHQL_BATCH_SIZE", "10")), 1)
 
     # Debugging
+    METRICS_PATH = getenv("INPUT_METRICS_PATH", "")
+    METRICS_STEP_SUMMARY = getenv("INPUT_METRICS_STEP_SUMMARY", "False").lower() in _TRUTHY
     DEBUG_LOGGING = getenv("INPUT_DEBUG_LOGGING", "0").lower() in _TRUTHY
     DEBUG_RUN = getenv("DEBUG_RUN", "False").lower() in _TRUTHY
+    HTTP_CASSETTE = getenv("HTTP_CASSETTE", "").lower()  # "record" Or "replay"
+
+    # Batch Users Without A WakaTime API Key Skip Every Section Built From WakaTime Data
+    @staticmethod
+    def ShowWakaTimeStats() -> bool:
+        sections = EnvironmentManager.SHOW_COMMIT or EnvironmentManager.SHOW_DAYS_OF_WEEK or EnvironmentManager.ShowWeeklyActivity()
+        return bool(EnvironmentManager.WAKATIME_API_KEY) and sections
+
+    @staticmethod
+    def ShowTotalCodeTime() -> bool:
+        return bool(EnvironmentManager.WAKATIME_API_KEY) and EnvironmentManager.SHOW_TOTAL_CODE_TIME
+
+    @staticmethod
+    def ShowWeeklyActivity() -> bool:
+        return (
+            EnvironmentManager.SHOW_TIMEZONE
+            or EnvironmentManager.SHOW_LANGUAGE
+            or EnvironmentManager.SHOW_EDITORS
+            or EnvironmentManager.SHOW_PROJECTS
+            or EnvironmentManager.SHOW_OS
+        )
@@ -1,24 +1,58 @@
-from os.path import join, isfile
+from gzip import open as open_gzip
+from os import makedirs
+from os.path import dirname, join, isfile
 from pickle import load as load_pickle, dump as dump_pickle
+from tempfile import mkdtemp
 from typing import Optional, Any
 
+from ManagerEnvironment import EnvironmentManager as EM
+from ManagerScope import ScopeManager
+
+
+class FileManager(metaclass=ScopeManager):
+    _SCOPED = ("USER_DIR",)
 
-class FileManager:
     ASSETS_DIR = "assets"
+    # Directory Holding Everything Kept Between Runs (Commit Store, HTTP Cache, Last Chart Render), Batch Users Get A Subdirectory.
+    # Requests Depend On What Is Stored, So Recording And Replaying A Cassette Both Start From An Empty One
+    STORE_DIR = mkdtemp(prefix="wakatime-stats-cassette-") if EM.HTTP_CASSETTE else EM.STORE_PATH
+    # Directory Holding The Files Of The Current User (Chart, Commit Store, Clone), Only Set In Batch Runs
+    USER_DIR = ""
 
+    # Path Of A Per-User File, Relative To The Working Directory
     @staticmethod
-    def WriteFile(name: str, content: str, append: bool = False, assets: bool = False):
+    def UserPath(path: str) -> str:
+        return join(FileManager.USER_DIR, path)
+
+    @staticmethod
+    def StorePath(name: str, user: bool = False) -> str:
+        return join(FileManager.STORE_DIR, FileManager.USER_DIR, name) if user else join(FileManager.STORE_DIR, name)
+
+    @staticmethod
+    def _path(name: str, assets: bool, user: bool, store: bool = False) -> str:
+        if store:
+            return FileManager.StorePath(name, user)
         name = join(FileManager.ASSETS_DIR, name) if assets else name
+        return FileManager.UserPath(name) if user else name
+
+    @staticmethod
+    def WriteFile(name: str, content: str, append: bool = False, assets: bool = False, user: bool = False):
+        name = FileManager._path(name, assets, user)
         with open(name, "a" if append else "w", encoding="utf-8") as file:
             file.write(content)
 
+    # Files Shared By All Users Of A Batch (E.g. The HTTP Cache) Leave `user` Unset, Files Kept Between Runs Set `store`
     @staticmethod
-    def CacheBinary(name: str, content: Optional[Any] = None, assets: bool = False) -> Optional[Any]:
-        name = join(FileManager.ASSETS_DIR, name) if assets else name
+    def CacheBinary(
+        name: str, content: Optional[Any] = None, assets: bool = False, compressed: bool = False, user: bool = False, store: bool = False
+    ) -> Optional[Any]:
+        name = FileManager._path(name, assets, user, store)
         if content is None and not isfile(name):
             return None
+        if content is not None and store:
+            makedirs(dirname(name), exist_ok=True)
 
-        with open(name, "rb" if content is None else "wb") as file:
+        with (open_gzip if compressed else open)(name, "rb" if content is None else "wb") as file:
             if content is None:
                 try:
                     return load_pickle(file)
@@ -1,49 +1,119 @@
-from base64 import b64encode
+from base64 import b64decode, b64encode
+from filecmp import cmp
+from hashlib import sha1
 from os import environ, makedirs
-from os.path import dirname, join
+from os.path import dirname, isfile, join, normpath
 from random import choice
-from re import sub
+from re import search, sub
 from shutil import copy, rmtree
 from string import ascii_letters
-
-from git import Repo, Actor
-from github import Github, AuthenticatedUser, Repository
+from types import SimpleNamespace
+from typing import Dict, Optional, Set, Tuple, TYPE_CHECKING
 
 from ManagerEnvironment import EnvironmentManager as EM
 from ManagerDebug import DebugManager as DBM
+from ManagerDownload import DownloadManager as DM
+from ManagerFile import FileManager as FM
+from ManagerRequest import RequestManager as RQM
+from ManagerScope import ScopeManager
+
+# GitPython Is Only Imported Once The Repository Is Cloned And PyGithub Only To Publish Through The API
+if TYPE_CHECKING:
+    from git import Repo, Actor
+    from github.Repository import Repository
 
 
-def InitGithubManager():
-    GitHubManager.PrepareGithubEnv()
+async def InitGithubManager():
+    await GitHubManager.PrepareGithubEnv()
     DBM.i(f"Current User : {GitHubManager.USER.login}.")
 
 
-class GitHubManager:
-    USER: AuthenticatedUser
-    REPO: Repo
-    REMOTE: Repository
+class GitHubManager(metaclass=ScopeManager):
+    _SCOPED = ("USER", "REPO", "REMOTE_NAME", "_DEFAULT_BRANCH", "_REPO_PATH", "_README", "_changed", "_staged", "_unverified")
+
+    # Attributes As Returned By The REST `/user` Endpoint (login, node_id, disk_usage, public_repos, ...)
+    USER: SimpleNamespace
+    # Clone Kept Between Refresh Cycles Of The Service Mode
+    REPO: Optional["Repo"] = None
 
-    _REMOTE_NAME: str
+    REMOTE_NAME: str
+    _DEFAULT_BRANCH: str
     _REPO_PATH: str
+    # REST `/readme` Response (path, Base64 content, ...) Of The Base Branch, Loaded Before Publishing
+    _README: Optional[Dict] = None
     _SINGLE_COMMIT_BRANCH = "latest_branch"
 
     _START_COMMENT = f"<!--START_SECTION:{EM.SECTION_NAME}-->"
     _END_COMMENT = f"<!--END_SECTION:{EM.SECTION_NAME}-->"
     _README_REGEX = f"{_START_COMMENT}[\\s\\S]+{_END_COMMENT}"
+    # The Date Line Added By `SHOW_UPDATED_DATE` Changes Every Run, So It Alone Doesn't Count As A Change
+    _UPDATED_DATE_REGEX = r"\n Last Updated On [^\n]*"
+    # Private Profile Fields Are Only Returned For Tokens With The User Scope, Missing Ones Read As None
+    _USER_FIELDS = ("email", "disk_usage", "hireable", "public_repos", "owned_private_repos")
+
+    # Set Once The README Section Or A Chart Differs From What The Repository Already Holds
+    _changed = False
+    # Repository Path -> New Content, Committed Through The Git Data API When `PUBLISH_MODE` Is "api"
+    _staged: Dict[str, bytes] = {}
+    # Staged Paths Not Yet Compared With The Remote Copy, Which Is Left For The Publishing Thread
+    _unverified: Set[str] = set()
 
     @staticmethod
-    def PrepareGithubEnv():
-        github = Github(EM.GH_TOKEN)
-        clone_path = "repo"
-        GitHubManager.USER = github.get_user()
-        rmtree(clone_path, ignore_errors=True)
+    async def PrepareGithubEnv():
+        GitHubManager.USER = SimpleNamespace(**(dict.fromkeys(GitHubManager._USER_FIELDS) | await DM.GetRemoteRest("user")))
+        GitHubManager.REMOTE_NAME = EM.REPOSITORY or f"{GitHubManager.USER.login}/I8o8i-WakaTime-Stats"
+        GitHubManager._REPO_PATH = f"https://{EM.GH_TOKEN}@github.com/{GitHubManager.REMOTE_NAME}.git"
+        GitHubManager._DEFAULT_BRANCH = (await DM.GetRemoteRest(f"repos/{GitHubManager.REMOTE_NAME}"))["default_branch"]
+        # Nothing Is Staged Yet, Also When A Refresh Cycle Of The Service Mode Follows A Previous One
+        GitHubManager._README = None
+        GitHubManager._changed = False
+        GitHubManager._staged = dict()
+        GitHubManager._unverified = set()
+
+    # Awaits The README Download Started With The Other Static Resources
+    @staticmethod
+    async def LoadReadme():
+        GitHubManager._README = await DM.GetRemoteJson("github_readme")
+
+    @staticmethod
+    def CloneRepository():
+        with DBM.Span("Clone"):
+            if GitHubManager.REPO is None:
+                GitHubManager._clone_repository()
+            else:
+                GitHubManager._update_repository()
+            GitHubManager._checkout_branches()
 
-        GitHubManager._REMOTE_NAME = environ.get("GITHUB_REPOSITORY", f"{GitHubManager.USER.login}/I8o8i-WakaTime-Stats")
-        GitHubManager._REPO_PATH = f"https://{EM.GH_TOKEN}@github.com/{GitHubManager._REMOTE_NAME}.git"
+    @staticmethod
+    def _clone_repository():
+        from git import Repo
 
-        GitHubManager.REMOTE = github.get_repo(GitHubManager._REMOTE_NAME)
-        GitHubManager.REPO = Repo.clone_from(GitHubManager._REPO_PATH, to_path=clone_path)
+        clone_path = FM.UserPath("repo")
+        rmtree(clone_path, ignore_errors=True)
+        if EM.SPARSE_CLONE:
+            # Only The Tip Of The Needed Branch, With Blobs Fetched Just For The Root Files, The README And The Assets
+            branch = GitHubManager.Branch(EM.PULL_BRANCH_NAME if EM.COMMIT_SINGLE else EM.PUSH_BRANCH_NAME)
+            options = {"branch": branch, "depth": 1, "filter": "blob:none", "sparse": True}
+            GitHubManager.REPO = Repo.clone_from(GitHubManager._REPO_PATH, to_path=clone_path, **options)
+            directories = {FM.ASSETS_DIR, dirname(GitHubManager._README["path"])} - {""}
+            GitHubManager.REPO.git.sparse_checkout("set", *sorted(directories))
+        else:
+            GitHubManager.REPO = Repo.clone_from(GitHubManager._REPO_PATH, to_path=clone_path)
 
+    # Brings The Clone Of A Previous Refresh Cycle Up To Date, Fetching Only The New Tip Of The Base Branch
+    @staticmethod
+    def _update_repository():
+        branch = GitHubManager.BaseBranch()
+        options = {"depth": 1} if EM.SPARSE_CLONE else dict()
+        GitHubManager.REPO.remotes.origin.fetch(f"+refs/heads/{branch}:refs/remotes/origin/{branch}", **options)
+        # Whatever The Previous Cycle Wrote Without Committing Is Dropped
+        GitHubManager.REPO.git.checkout("--force", "-B", branch, f"origin/{branch}")
+        GitHubManager.REPO.git.clean("--force", "-d")
+        if GitHubManager._SINGLE_COMMIT_BRANCH in [head.name for head in GitHubManager.REPO.heads]:
+            GitHubManager.REPO.git.branch("--delete", "--force", GitHubManager._SINGLE_COMMIT_BRANCH)
+
+    @staticmethod
+    def _checkout_branches():
         if EM.COMMIT_SINGLE:
             GitHubManager.REPO.git.checkout(GitHubManager.Branch(EM.PULL_BRANCH_NAME))
             GitHubManager.REPO.git.checkout("--orphan", GitHubManager._SINGLE_COMMIT_BRANCH)
@@ -51,68 +121,182 @@ class GitHubManager:
             GitHubManager.REPO.git.checkout(GitHubManager.Branch(EM.PUSH_BRANCH_NAME))
 
     @staticmethod
-    def _get_author() -> Actor:
+    def _get_identity() -> Tuple[str, str]:
         if EM.COMMIT_BY_ME:
-            return Actor(EM.COMMIT_USERNAME or GitHubManager.USER.login, EM.COMMIT_EMAIL or GitHubManager.USER.email)
-        return Actor(EM.COMMIT_USERNAME or "readme-bot", EM.COMMIT_EMAIL or "41898282+github-actions[bot]@users.noreply.github.com")
+            return EM.COMMIT_USERNAME or GitHubManager.USER.login, EM.COMMIT_EMAIL or GitHubManager.USER.email
+        return EM.COMMIT_USERNAME or "readme-bot", EM.COMMIT_EMAIL or "41898282+github-actions[bot]@users.noreply.github.com"
+
+    @staticmethod
+    def _get_author() -> "Actor":
+        from git import Actor
+
+        return Actor(*GitHubManager._get_identity())
 
     @staticmethod
     def Branch(requested_branch: str) -> str:
-        return GitHubManager.REMOTE.default_branch if requested_branch == "" else requested_branch
+        return GitHubManager._DEFAULT_BRANCH if requested_branch == "" else requested_branch
 
+    # The Branch The New Commit Is Built On: The Pushed One, Or The One A Single Commit Is Rebuilt From
     @staticmethod
-    def _copy_file_and_add_to_repo(src_path: str):
-        dst_path = join(GitHubManager.REPO.working_tree_dir, src_path)
+    def BaseBranch() -> str:
+        return GitHubManager.Branch(EM.PULL_BRANCH_NAME if EM.COMMIT_SINGLE else EM.PUSH_BRANCH_NAME)
+
+    # `path` Is Relative To The Repository, The Local Copy Is In The User's Directory
+    @staticmethod
+    def _copy_file_and_add_to_repo(path: str, src_path: str):
+        if EM.PUBLISH_MODE == "api":
+            with open(src_path, "rb") as file:
+                GitHubManager._staged[normpath(path)] = file.read()
+            GitHubManager._unverified.add(normpath(path))
+            return
+        dst_path = join(GitHubManager.REPO.working_tree_dir, path)
+        if isfile(dst_path) and cmp(src_path, dst_path, shallow=False):
+            DBM.i(f"\t{path} Is Unchanged.")
+            return
         makedirs(dirname(dst_path), exist_ok=True)
         copy(src_path, dst_path)
         GitHubManager.REPO.git.add(dst_path)
+        GitHubManager._changed = True
+
+    @staticmethod
+    def _without_date(section: str) -> str:
+        return sub(GitHubManager._UPDATED_DATE_REGEX, "", section)
 
+    # The README Download Runs Alongside The Crawl And Is Only Awaited Here, Unless The Sparse Clone Needed It Before
     @staticmethod
-    def UpdateReadme(stats: str):
+    async def UpdateReadme(stats: str):
         DBM.i("Updating README...")
-        readme_path = join(GitHubManager.REPO.working_tree_dir, GitHubManager.REMOTE.get_readme().path)
-        with open(readme_path, "r") as readme_file:
-            readme_contents = readme_file.read()
+        if GitHubManager._README is None:
+            await GitHubManager.LoadReadme()
+        if EM.PUBLISH_MODE == "api":
+            readme_path, readme_contents = GitHubManager._README["path"], b64decode(GitHubManager._README["content"]).decode("utf-8")
+        else:
+            readme_path = join(GitHubManager.REPO.working_tree_dir, GitHubManager._README["path"])
+            with open(readme_path, "r") as readme_file:
+                readme_contents = readme_file.read()
         readme_stats = f"{GitHubManager._START_COMMENT}\n{stats}\n{GitHubManager._END_COMMENT}"
+        previous = search(GitHubManager._README_REGEX, readme_contents)
+        if previous is not None and GitHubManager._without_date(previous.group(0)) == GitHubManager._without_date(readme_stats):
+            DBM.g("README Stats Unchanged.")
+        else:
+            GitHubManager._changed = True
+
+        # Still Written, So The Date Is Current Whenever Something Else (E.g. The Chart) Gets Committed
         new_readme = sub(GitHubManager._README_REGEX, readme_stats, readme_contents)
-        with open(readme_path, "w") as readme_file:
-            readme_file.write(new_readme)
-        GitHubManager.REPO.git.add(readme_path)
+        if EM.PUBLISH_MODE == "api":
+            GitHubManager._staged[readme_path] = new_readme.encode("utf-8")
+        else:
+            with open(readme_path, "w") as readme_file:
+                readme_file.write(new_readme)
+            GitHubManager.REPO.git.add(readme_path)
         DBM.g("README Updated!")
 
+    # `path` Is Where The Chart Goes In The Repository, `source` The Local File It Was Rendered To
     @staticmethod
-    def UpdateChart(name: str, path: str) -> str:
+    def UpdateChart(name: str, path: str, source: str) -> str:
         output = str()
         DBM.i(f"Updating {name} Chart...")
         if not EM.DEBUG_RUN:
             DBM.i("\tAdding Chart To Repo...")
-            GitHubManager._copy_file_and_add_to_repo(path)
-            chart_path = f"https://raw.githubusercontent.com/{GitHubManager._REMOTE_NAME}/{GitHubManager.Branch(EM.PUSH_BRANCH_NAME)}/{path}"
+            GitHubManager._copy_file_and_add_to_repo(path, source)
+            chart_path = f"https://raw.githubusercontent.com/{GitHubManager.REMOTE_NAME}/{GitHubManager.Branch(EM.PUSH_BRANCH_NAME)}/{path}"
             output += f"![{name} chart]({chart_path})\n\n"
         else:
             DBM.i("\tInlining Chart...")
             hint = "Use [this website](https://codebeautify.org/base64-to-image-converter) To View The image."
-            with open(path, "rb") as input_file:
-                output += f"{hint}\n```\ndata:image/png;base64,{b64encode(input_file.read()).decode('utf-8')}\n```\n\n"
+            mime = "image/svg+xml" if path.endswith(".svg") else "image/png"
+            with open(source, "rb") as input_file:
+                output += f"{hint}\n```\ndata:{mime};base64,{b64encode(input_file.read()).decode('utf-8')}\n```\n\n"
         return output
 
     @staticmethod
     def CommitUpdate():
+        if EM.PUBLISH_MODE == "api":
+            GitHubManager._drop_unchanged_files()
+        # A Single Commit Built From Another Branch Can't Be Compared With The Pushed One, So It Is Always Pushed
+        rebuilds_other_branch = EM.COMMIT_SINGLE and GitHubManager.Branch(EM.PULL_BRANCH_NAME) != GitHubManager.Branch(EM.PUSH_BRANCH_NAME)
+        if not GitHubManager._changed and not rebuilds_other_branch:
+            DBM.g("Nothing Changed Since The Last Run, Skipping Commit And Push.")
+            return
+        if EM.PUBLISH_MODE == "api":
+            with DBM.Span("Push"):
+                GitHubManager._commit_through_api()
+            return
+
         actor = GitHubManager._get_author()
         DBM.i("Committing Files To Repo...")
         GitHubManager.REPO.index.commit(EM.COMMIT_MESSAGE, author=actor, committer=actor)
-        if EM.COMMIT_SINGLE:
-            DBM.i("Pushing Files To Repo As A Single Commit...")
-            refspec = f"{GitHubManager._SINGLE_COMMIT_BRANCH}:{GitHubManager.Branch(EM.PUSH_BRANCH_NAME)}"
-            headers = GitHubManager.REPO.remotes.origin.push(force=True, refspec=refspec)
-        else:
-            DBM.i("Pushing Files To Repo...")
-            headers = GitHubManager.REPO.remotes.origin.push()
+        with DBM.Span("Push"):
+            if EM.COMMIT_SINGLE:
+                DBM.i("Pushing Files To Repo As A Single Commit...")
+                refspec = f"{GitHubManager._SINGLE_COMMIT_BRANCH}:{GitHubManager.Branch(EM.PUSH_BRANCH_NAME)}"
+                headers = GitHubManager.REPO.remotes.origin.push(force=True, refspec=refspec)
+            else:
+                DBM.i("Pushing Files To Repo...")
+                headers = GitHubManager.REPO.remotes.origin.push()
         if len(headers) == 0:
             DBM.i(f"Repository Push Error : {headers}!")
         else:
             DBM.i("Repository Synchronized!")
 
+    @staticmethod
+    def _remote() -> "Repository":
+        from github import Github
+
+        return Github(EM.GH_TOKEN).get_repo(GitHubManager.REMOTE_NAME, lazy=True)
+
+    @staticmethod
+    def _drop_unchanged_files():
+        from github import UnknownObjectException
+
+        remote = GitHubManager._remote()
+        for path in GitHubManager._unverified:
+            try:
+                remote_sha = RQM.Call(path, lambda: remote.get_contents(path, ref=GitHubManager.BaseBranch()).sha)
+            except UnknownObjectException:
+                remote_sha = None
+            # Git Names Blobs By The SHA-1 Of A Short Header Plus The Content, So Equal Hashes Mean Equal Bytes
+            content = GitHubManager._staged[path]
+            if remote_sha == sha1(b"blob %d\0" % len(content) + content).hexdigest():
+                DBM.i(f"\t{path} Is Unchanged.")
+                GitHubManager._staged.pop(path)
+            else:
+                GitHubManager._changed = True
+        GitHubManager._unverified.clear()
+
+    # Creates The Blobs, Tree And Commit Remotely And Moves The Branch, Without Any Local Repository
+    @staticmethod
+    def _commit_through_api():
+        from github import InputGitAuthor, InputGitTreeElement, UnknownObjectException
+
+        remote = GitHubManager._remote()
+        DBM.i("Committing Files Through The Git Data API...")
+        base_ref = RQM.Call("Base Branch", lambda: remote.get_git_ref(f"heads/{GitHubManager.BaseBranch()}"))
+        base_commit = RQM.Call("Base Commit", lambda: remote.get_git_commit(base_ref.object.sha))
+
+        elements = []
+        for path, content in GitHubManager._staged.items():
+            blob = RQM.Call(f"Blob {path}", lambda: remote.create_git_blob(b64encode(content).decode("utf-8"), "base64"))
+            elements.append(InputGitTreeElement(path, "100644", "blob", sha=blob.sha))
+        tree = RQM.Call("Tree", lambda: remote.create_git_tree(elements, base_tree=base_commit.tree))
+
+        author = InputGitAuthor(*GitHubManager._get_identity())
+        parents = [] if EM.COMMIT_SINGLE else [base_commit]
+        commit = RQM.Call("Commit", lambda: remote.create_git_commit(EM.COMMIT_MESSAGE, tree, parents, author=author, committer=author))
+
+        if not EM.COMMIT_SINGLE:
+            DBM.i("Updating Branch...")
+            RQM.Call("Update Branch", lambda: base_ref.edit(commit.sha))
+        else:
+            DBM.i("Replacing Branch With A Single Commit...")
+            push_branch = GitHubManager.Branch(EM.PUSH_BRANCH_NAME)
+            try:
+                push_ref = RQM.Call("Push Branch", lambda: remote.get_git_ref(f"heads/{push_branch}"))
+                RQM.Call("Update Branch", lambda: push_ref.edit(commit.sha, force=True))
+            except UnknownObjectException:
+                RQM.Call("Create Branch", lambda: remote.create_git_ref(f"refs/heads/{push_branch}", commit.sha))
+        DBM.i("Repository Synchronized!")
+
     @staticmethod
     def SetGithubOutput(stats: str):
         DBM.i("Setting README Contents As Action Output...")
@@ -0,0 +1,77 @@
+from hashlib import md5
+from time import time
+from typing import Awaitable, Callable, Dict, Optional
+
+from httpx import Request, Response, TransportError
+
+from ManagerDebug import DebugManager as DBM
+from ManagerFile import FileManager as FM
+
+
+class HttpCacheManager:
+    _CACHE_FILE = "http_cache.pick"
+
+    _entries: Optional[Dict[str, Dict]] = None
+
+    @staticmethod
+    def _load() -> Dict[str, Dict]:
+        if HttpCacheManager._entries is None:
+            entries = FM.CacheBinary(HttpCacheManager._CACHE_FILE, store=True)
+            HttpCacheManager._entries = entries if isinstance(entries, Dict) else dict()
+        return HttpCacheManager._entries
+
+    @staticmethod
+    def _store(key: str, res: Response):
+        HttpCacheManager._load()[key] = {
+            "etag": res.headers.get("etag"),
+            "last_modified": res.headers.get("last-modified"),
+            "fetched_at": time(),
+            "content": res.content,
+        }
+        FM.CacheBinary(HttpCacheManager._CACHE_FILE, HttpCacheManager._entries, store=True)
+
+    @staticmethod
+    def _cached_response(url: str, entry: Dict) -> Response:
+        return Response(200, content=entry["content"], request=Request("GET", url))
+
+    # Serves Fresh Copies From Disk, Revalidates Stale Ones With ETag / Last-Modified
+    # And Falls Back To The Last Good Copy When The Network Or The Server Fails.
+    # `fetch` Performs The Actual Request With The Given Conditional Headers.
+    @staticmethod
+    async def Get(url: str, max_age: float, fetch: Callable[[Dict[str, str]], Awaitable[Response]]) -> Response:
+        key = md5(url.encode("utf-8")).hexdigest()
+        entry = HttpCacheManager._load().get(key)
+
+        if entry is not None and time() - entry["fetched_at"] < max_age:
+            DBM.Count("cache_lookups", cache="http", result="hit")
+            DBM.g(f"\tServing '{url.split('?')[0]}' From HTTP Cache.")
+            return HttpCacheManager._cached_response(url, entry)
+
+        headers = dict()
+        if entry is not None and entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry is not None and entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+        try:
+            res = await fetch(headers)
+        except TransportError as error:
+            if entry is None:
+                raise
+            DBM.Count("cache_lookups", cache="http", result="stale")
+            DBM.w(f"\tRequest To '{url.split('?')[0]}' Failed ({error}), Using Last Cached Copy.")
+            return HttpCacheManager._cached_response(url, entry)
+
+        if res.status_code == 304 and entry is not None:
+            DBM.Count("cache_lookups", cache="http", result="revalidated")
+            entry["fetched_at"] = time()
+            FM.CacheBinary(HttpCacheManager._CACHE_FILE, HttpCacheManager._entries, store=True)
+            return HttpCacheManager._cached_response(url, entry)
+        if res.status_code == 200:
+            DBM.Count("cache_lookups", cache="http", result="miss")
+            HttpCacheManager._store(key, res)
+        elif res.status_code >= 500 and entry is not None:
+            DBM.Count("cache_lookups", cache="http", result="stale")
+            DBM.w(f"\tRequest To '{url.split('?')[0]}' Returned {res.status_code}, Using Last Cached Copy.")
+            return HttpCacheManager._cached_response(url, entry)
+        return res
@@ -0,0 +1,90 @@
+from asyncio import Lock, sleep
+from datetime import datetime
+from time import time
+from typing import Dict, Optional
+
+from httpx import Response
+
+from ManagerDebug import DebugManager as DBM
+from ManagerEnvironment import EnvironmentManager as EM
+from ManagerScope import ScopeManager
+
+
+class RateLimitManager(metaclass=ScopeManager):
+    # Start Pacing Requests Once Fewer Than This Many Calls Are Left Above The Reserve
+    _PACING_WINDOW = 100
+    # Budgets Belong To A Token, So Each Batch User Tracks And Waits For Its Own
+    _SCOPED = ("_remaining", "_reset_at", "_blocked_until", "_points_used", "_lock")
+
+    # GitHub Keeps Separate Budgets Per Resource (E.g. "core" For REST, "graphql" For GraphQL Points)
+    _remaining: Dict[str, int] = {}
+    _reset_at: Dict[str, float] = {}
+    _blocked_until: float = 0.0
+    _points_used = 0
+    _lock = Lock()
+
+    @staticmethod
+    def Update(response: Response):
+        # Only GitHub's Budget Is Tracked, Other Hosts Use Unrelated Rate Limit Headers
+        if response.request.url.host != "api.github.com":
+            return
+        headers = response.headers
+        resource = headers.get("x-ratelimit-resource", "core")
+        if "x-ratelimit-remaining" in headers:
+            RateLimitManager._remaining[resource] = int(headers["x-ratelimit-remaining"])
+        if "x-ratelimit-reset" in headers:
+            RateLimitManager._reset_at[resource] = float(headers["x-ratelimit-reset"])
+
+        if "retry-after" in headers:
+            RateLimitManager._block(float(headers["retry-after"]))
+        elif RateLimitManager._remaining.get(resource) == 0 and response.status_code in {403, 429}:
+            RateLimitManager._block(RateLimitManager._reset_at.get(resource, time()) - time())
+
+    @staticmethod
+    def RecordGraphqlCost(rate_limit: Optional[Dict]):
+        if not rate_limit:
+            return
+        RateLimitManager._points_used += rate_limit["cost"]
+        RateLimitManager._remaining["graphql"] = rate_limit["remaining"]
+        RateLimitManager._reset_at["graphql"] = datetime.fromisoformat(rate_limit["resetAt"].replace("Z", "+00:00")).timestamp()
+
+    @staticmethod
+    def GetUsage() -> Dict:
+        return {
+            "points_used": RateLimitManager._points_used,
+            "points_remaining": RateLimitManager._remaining.get("graphql"),
+            "reset_at": RateLimitManager._reset_at.get("graphql"),
+        }
+
+    @staticmethod
+    def _block(seconds: float):
+        until = time() + max(seconds, 0.0)
+        if until > RateLimitManager._blocked_until:
+            DBM.w(f"\tRate Limited By GitHub, Pausing Requests For {seconds:.1f}s.")
+            RateLimitManager._blocked_until = until
+
+    @staticmethod
+    def _delay(resource: str) -> float:
+        now = time()
+        if RateLimitManager._blocked_until > now:
+            return RateLimitManager._blocked_until - now
+
+        remaining = RateLimitManager._remaining.get(resource)
+        if remaining is None:
+            return 0.0
+        # The Reserve Is Left Untouched For Other Jobs Sharing The Same Token
+        available = remaining - EM.RATE_LIMIT_RESERVE
+        until_reset = max(RateLimitManager._reset_at.get(resource, now) - now, 0.0)
+        if available <= 0:
+            return until_reset
+        if available > RateLimitManager._PACING_WINDOW:
+            return 0.0
+        # Spread What Is Left Of The Budget Evenly Until The Window Resets
+        return until_reset / available
+
+    @staticmethod
+    async def Wait(resource: str = "core"):
+        async with RateLimitManager._lock:
+            delay = RateLimitManager._delay(resource)
+            if delay > 0:
+                await sleep(delay)
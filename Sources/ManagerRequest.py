@@ -0,0 +1,143 @@
+from asyncio import sleep
+from random import uniform
+from time import monotonic, sleep as block
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from httpx import Response, TransportError
+
+from ManagerDebug import DebugManager as DBM
+from ManagerEnvironment import EnvironmentManager as EM
+from ManagerRateLimit import RateLimitManager as RLM
+
+
+class RequestManager:
+    # Error Class -> (Max Retries, Base Delay, Max Delay), Delays In Seconds
+    _POLICIES: Dict[str, Tuple[int, float, float]] = {
+        "network": (5, 1.0, 30.0),
+        "server": (5, 1.0, 30.0),
+        "rate limit": (6, 60.0, 300.0),
+        "graphql": (3, 2.0, 30.0),
+    }
+    _ATTEMPT_TIMEOUT = 60.0
+
+    @staticmethod
+    def _backoff(error_class: str, attempt: int) -> float:
+        _, base, cap = RequestManager._POLICIES[error_class]
+        delay = min(cap, base * 2**attempt)
+        # Equal Jitter Keeps A Minimum Wait While Spreading Concurrent Retries Apart
+        return delay / 2 + uniform(0, delay / 2)
+
+    @staticmethod
+    def ClassifyResponse(res: Response) -> Optional[str]:
+        if res.status_code in {500, 502, 503, 504}:
+            return "server"
+        if res.status_code == 429:
+            return "rate limit"
+        if res.status_code == 403 and ("retry-after" in res.headers or res.headers.get("x-ratelimit-remaining") == "0" or "rate limit" in res.text.lower()):
+            return "rate limit"
+        return None
+
+    @staticmethod
+    def ClassifyGraphqlResponse(res: Response) -> Optional[str]:
+        error_class = RequestManager.ClassifyResponse(res)
+        if error_class is not None or res.status_code != 200:
+            return error_class
+
+        body = res.json()
+        errors = body.get("errors") or []
+        if any(error.get("type") == "RATE_LIMITED" for error in errors):
+            return "rate limit"
+        # Errors Without Any Data Are Usually Server-Side Timeouts, Partial Data (E.g. One Missing Repository) Is Kept
+        if errors and not body.get("data"):
+            return "graphql"
+        return None
+
+    @staticmethod
+    def _classify_exception(error: Exception) -> Optional[str]:
+        status = getattr(error, "status", None)
+        if status in {500, 502, 503, 504}:
+            return "server"
+        if status in {403, 429} and "rate limit" in str(error).lower():
+            return "rate limit"
+        if isinstance(error, (TransportError, OSError)):
+            return "network"
+        return None
+
+    @staticmethod
+    def _give_up(name: str, error_class: str, attempts: Dict[str, int], delay: float, deadline: float) -> bool:
+        attempt = attempts.get(error_class, 0)
+        attempts[error_class] = attempt + 1
+        DBM.Count("http_failures", error_class=error_class)
+        if attempt >= RequestManager._POLICIES[error_class][0] or monotonic() + delay >= deadline:
+            DBM.p(f"\tRequest '{name}' Failed With A {error_class} Error, Giving Up.")
+            return True
+        DBM.w(f"\tRequest '{name}' Failed With A {error_class} Error, Retry {attempt + 1} In {delay:.1f}s.")
+        return False
+
+    @staticmethod
+    def _count(res: Response):
+        host = res.request.url.host
+        DBM.Count("http_requests", host=host)
+        DBM.Count("http_request_bytes", len(res.request.content), host=host)
+        DBM.Count("http_response_bytes", len(res.content), host=host)
+        # Shows Whether Requests Were Multiplexed Over HTTP/2 Or Sent Over HTTP/1.1 Connections
+        version = res.extensions.get("http_version")
+        if version is not None:
+            DBM.Count("http_responses", host=host, version=version.decode("ascii"))
+
+    # Sends An HTTP Request Until It Succeeds, Its Error Class Runs Out Of Retries Or The Time Budget Is Spent.
+    # `send` Receives The Timeout Of The Current Attempt; The Last Response Is Returned Even If It Failed.
+    @staticmethod
+    async def Execute(
+        name: str,
+        send: Callable[[float], Awaitable[Response]],
+        classify: Optional[Callable[[Response], Optional[str]]] = None,
+        budget: Optional[float] = None,
+        resource: str = "core",
+    ) -> Response:
+        classify = classify or RequestManager.ClassifyResponse
+        deadline = monotonic() + (budget or EM.REQUEST_TIMEOUT_BUDGET)
+        attempts = dict()
+
+        while True:
+            await RLM.Wait(resource)
+            try:
+                res = await send(max(min(RequestManager._ATTEMPT_TIMEOUT, deadline - monotonic()), 1.0))
+            except TransportError:
+                delay = RequestManager._backoff("network", attempts.get("network", 0))
+                if RequestManager._give_up(name, "network", attempts, delay, deadline):
+                    raise
+                await sleep(delay)
+                continue
+
+            RLM.Update(res)
+            RequestManager._count(res)
+            error_class = classify(res)
+            if error_class is None:
+                return res
+
+            # The Rate Limiter Only Tracks GitHub, So A Retry-After Header Of Any Host Is Waited For Here
+            delay = max(RequestManager._backoff(error_class, attempts.get(error_class, 0)), float(res.headers.get("retry-after", 0)))
+            if RequestManager._give_up(name, error_class, attempts, delay, deadline):
+                return res
+            await sleep(delay)
+
+    # Blocking Counterpart Of `Execute` For PyGithub Calls, Which Raise Instead Of Returning Responses
+    @staticmethod
+    def Call(name: str, fn: Callable[[], Any], budget: Optional[float] = None) -> Any:
+        deadline = monotonic() + (budget or EM.REQUEST_TIMEOUT_BUDGET)
+        attempts = dict()
+
+        while True:
+            DBM.Count("http_requests", host="api.github.com")
+            try:
+                return fn()
+            except Exception as error:
+                error_class = RequestManager._classify_exception(error)
+                if error_class is None:
+                    raise
+                headers = getattr(error, "headers", None) or {}
+                delay = max(RequestManager._backoff(error_class, attempts.get(error_class, 0)), float(headers.get("retry-after", 0)))
+                if RequestManager._give_up(name, error_class, attempts, delay, deadline):
+                    raise
+                block(delay)
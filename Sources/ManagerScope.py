@@ -0,0 +1,39 @@
+from contextvars import ContextVar
+from copy import copy
+from typing import Any, Dict, Tuple
+
+# The Root Scope Is Shared By Every Context That Never Started Its Own, Which Is The Whole Process In Single User Runs
+_ROOT_SCOPE: Dict[Tuple[str, str], Any] = {}
+
+
+class ScopeManager(type):
+    # Metaclass Keeping The Class Attributes Named In `_SCOPED` Per Scope Instead Of On The Class.
+    # Tasks And Threads Started From A Scope Inherit It, So Batch Users Running Concurrently Each See Their Own State.
+    # Every Scope Starts From A Shallow Copy Of The Value Given In The Class Body.
+    _scope: ContextVar[Dict[Tuple[str, str], Any]] = ContextVar("scope", default=_ROOT_SCOPE)
+
+    def __new__(mcs, name: str, bases: Tuple, namespace: Dict):
+        namespace.setdefault("_SCOPED", ())
+        namespace["_SCOPED_DEFAULTS"] = {attr: namespace.pop(attr) for attr in namespace["_SCOPED"] if attr in namespace}
+        return super().__new__(mcs, name, bases, namespace)
+
+    def __getattr__(cls, attr: str) -> Any:
+        if attr not in cls._SCOPED:
+            raise AttributeError(f"type object '{cls.__name__}' has no attribute '{attr}'")
+        scope, key = ScopeManager._scope.get(), (cls.__name__, attr)
+        if key not in scope:
+            if attr not in cls._SCOPED_DEFAULTS:
+                raise AttributeError(f"'{cls.__name__}.{attr}' Is Not Set In This Scope")
+            scope[key] = copy(cls._SCOPED_DEFAULTS[attr])
+        return scope[key]
+
+    def __setattr__(cls, attr: str, value: Any):
+        if attr in cls._SCOPED:
+            ScopeManager._scope.get()[(cls.__name__, attr)] = value
+        else:
+            super().__setattr__(attr, value)
+
+    # Gives The Current Task (And Everything It Starts) A Fresh Scope
+    @staticmethod
+    def NewScope():
+        ScopeManager._scope.set(dict())
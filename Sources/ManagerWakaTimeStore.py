@@ -0,0 +1,142 @@
+from asyncio import Task, create_task, gather
+from datetime import date, timedelta
+from hashlib import sha256
+from typing import Dict, List, Optional, Tuple
+
+from ManagerCassette import CassetteManager as CSTM
+from ManagerDebug import DebugManager as DBM
+from ManagerDownload import DownloadManager as DM
+from ManagerEnvironment import EnvironmentManager as EM
+from ManagerFile import FileManager as FM
+from ManagerScope import ScopeManager
+
+
+class WakaTimeStoreManager(metaclass=ScopeManager):
+    _STORE_FILE = "wakatime_store.pick"
+    _STORE_VERSION = 1
+    # Days Requested Together In One Summaries Request
+    _CHUNK_DAYS = 30
+    _CATEGORIES = ["languages", "editors", "projects", "operating_systems"]
+    _SCOPED = ("_account", "_days", "_timezone", "_sync")
+
+    # Hash Of The API Key The Store Belongs To
+    _account: Optional[str] = None
+    # ISO Date -> {"total": Seconds, Category -> {Name -> Seconds}}
+    _days: Dict[str, Dict] = {}
+    _timezone: Optional[str] = None
+    _sync: Optional[Task] = None
+
+    @staticmethod
+    def _load():
+        # Refresh Cycles Of The Service Mode Keep Using The Store Left In Memory By The Previous Cycle
+        account = sha256(EM.WAKATIME_API_KEY.encode("utf-8")).hexdigest()
+        if WakaTimeStoreManager._account == account:
+            return
+        WakaTimeStoreManager._account, WakaTimeStoreManager._days, WakaTimeStoreManager._timezone = account, dict(), None
+
+        store = FM.CacheBinary(WakaTimeStoreManager._STORE_FILE, store=True, user=True)
+        if not isinstance(store, Dict) or store.get("version") != WakaTimeStoreManager._STORE_VERSION or store.get("account") != account:
+            DBM.w("\tNo Usable WakaTime Store Found, Fetching All Days.")
+            return
+        WakaTimeStoreManager._days, WakaTimeStoreManager._timezone = store["days"], store["timezone"]
+        DBM.g(f"\tWakaTime Store Loaded With {len(WakaTimeStoreManager._days)} Days.")
+
+    @staticmethod
+    def _save():
+        store = {
+            "version": WakaTimeStoreManager._STORE_VERSION,
+            "account": WakaTimeStoreManager._account,
+            "days": WakaTimeStoreManager._days,
+            "timezone": WakaTimeStoreManager._timezone,
+        }
+        FM.CacheBinary(WakaTimeStoreManager._STORE_FILE, store, store=True, user=True)
+        DBM.g(f"\tWakaTime Store Saved With {len(WakaTimeStoreManager._days)} Days.")
+
+    # Today In The User's WakaTime Timezone Once It Is Known, The Day Of The Recording When A Cassette Is Used
+    @staticmethod
+    def _today() -> date:
+        if WakaTimeStoreManager._timezone is None:
+            return CSTM.Now().date()
+        from pytz import timezone as zone
+
+        return CSTM.Now().astimezone(zone(WakaTimeStoreManager._timezone)).date()
+
+    @staticmethod
+    def _missing_ranges(first: date, today: date) -> List[Tuple[date, date]]:
+        # Today Is Still In Progress And Late Heartbeats Can Change Yesterday, So Both Are Always Fetched Again
+        missing = [first + timedelta(days=offset) for offset in range((today - first).days + 1)]
+        missing = [day for day in missing if day.isoformat() not in WakaTimeStoreManager._days or day >= today - timedelta(days=1)]
+
+        # Consecutive Missing Days Are Grouped Into Ranges Of At Most `_CHUNK_DAYS` Days
+        ranges = []
+        for day in missing:
+            if ranges and day - ranges[-1][1] == timedelta(days=1) and (day - ranges[-1][0]).days < WakaTimeStoreManager._CHUNK_DAYS:
+                ranges[-1] = (ranges[-1][0], day)
+            else:
+                ranges.append((day, day))
+        return ranges
+
+    @staticmethod
+    def _compact(summary: Dict) -> Dict:
+        day = {"total": summary["grand_total"]["total_seconds"]}
+        for category in WakaTimeStoreManager._CATEGORIES:
+            day[category] = {item["name"]: item["total_seconds"] for item in summary.get(category, []) if item["total_seconds"] > 0}
+        return day
+
+    @staticmethod
+    async def _synchronize():
+        DBM.i("Synchronizing WakaTime Store...")
+        WakaTimeStoreManager._load()
+        today = WakaTimeStoreManager._today()
+        first = today - timedelta(days=max(EM.WAKATIME_WINDOWS) - 1)
+
+        ranges = WakaTimeStoreManager._missing_ranges(first, today)
+        responses = await gather(*[DM.GetRemoteWakaTimeSummaries(start, end) for start, end in ranges])
+        for summaries in responses:
+            for summary in summaries or []:
+                WakaTimeStoreManager._days[summary["range"]["date"]] = WakaTimeStoreManager._compact(summary)
+                WakaTimeStoreManager._timezone = summary["range"].get("timezone") or WakaTimeStoreManager._timezone
+
+        # Days No Window Reaches Anymore Are Dropped
+        WakaTimeStoreManager._days = {day: data for day, data in WakaTimeStoreManager._days.items() if day >= first.isoformat()}
+        WakaTimeStoreManager._save()
+        DBM.g(f"WakaTime Store Synchronized, {sum((end - start).days + 1 for start, end in ranges)} Days Requested In {len(ranges)} Requests.")
+
+    # Starts Fetching The Missing Days In The Background, `Window` Waits For It
+    @staticmethod
+    def StartSync():
+        WakaTimeStoreManager._sync = create_task(WakaTimeStoreManager._synchronize())
+
+    @staticmethod
+    def _text(seconds: float) -> str:
+        hours, minutes = divmod(int(seconds) // 60, 60)
+        parts = [f"{hours} hr{'' if hours == 1 else 's'}"] if hours else []
+        if minutes or not hours:
+            parts.append(f"{minutes} min{'' if minutes == 1 else 's'}")
+        return " ".join(parts)
+
+    # Activity Of The Last `days` Days Including Today, In The Shape Of WakaTime's Own Stats Endpoint:
+    # Per Category A List Of {"name", "total_seconds", "text", "percent"} Sorted By Time Spent.
+    @staticmethod
+    async def Window(days: int) -> Optional[Dict]:
+        if WakaTimeStoreManager._sync is None:
+            WakaTimeStoreManager.StartSync()
+        await WakaTimeStoreManager._sync
+        if WakaTimeStoreManager._timezone is None:
+            return None
+
+        first = (WakaTimeStoreManager._today() - timedelta(days=days - 1)).isoformat()
+        window = [data for day, data in WakaTimeStoreManager._days.items() if day >= first]
+        stats = {"timezone": WakaTimeStoreManager._timezone, "total_seconds": sum(data["total"] for data in window)}
+        for category in WakaTimeStoreManager._CATEGORIES:
+            totals = dict()
+            for data in window:
+                for name, seconds in data[category].items():
+                    totals[name] = totals.get(name, 0) + seconds
+            overall = sum(totals.values()) or 1
+            ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)
+            stats[category] = [
+                {"name": name, "total_seconds": seconds, "text": WakaTimeStoreManager._text(seconds), "percent": round(seconds / overall * 100, 2)}
+                for name, seconds in ranked
+            ]
+        return stats
@@ -1,65 +1,125 @@
-from asyncio import sleep
 from json import dumps
-from re import search
-from datetime import datetime
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
+from CommitTable import CommitTable
+from ManagerCommitStore import CommitStoreManager as CSM
 from ManagerDownload import DownloadManager as DM
 from ManagerEnvironment import EnvironmentManager as EM
+from ManagerFile import FileManager as FM
 from ManagerGithub import GitHubManager as GHM
 from ManagerDebug import DebugManager as DBM
 
 
-async def CalculateCommitData(repositories: Dict) -> Tuple[Dict, Dict]:
+async def CalculateCommitData(repositories: Dict) -> CommitTable:
     DBM.i("Calculating Commit Data...")
-    yearly_data = {}
-    date_data = {}
+    commits = CommitTable()
+    # Oids Of Every Commit Already Counted, Shared By All Branches, Forks And Contributed Repositories
+    seen_oids = set()
+    CSM.Load(GHM.USER.node_id)
 
+    repositories = [repo for repo in repositories if repo["name"] not in EM.IGNORED_REPOS]
     for idx, repo in enumerate(repositories):
-        if repo["name"] not in EM.IGNORED_REPOS:
-            repo_name = "[private]" if repo["isPrivate"] else f"{repo['owner']['login']}/{repo['name']}"
-            DBM.i(f"\t{idx + 1}/{len(repositories)} Processing Repository: {repo_name}")
-            await UpdateDataWithCommitStats(repo, yearly_data, date_data)
-
-    DBM.g("Commit Data Computation Complete.")
+        DBM.i(f"\t{idx + 1}/{len(repositories)} Processing Repository: {RepositoryName(repo)}")
+
+    branch_lists = await DM.GetRemoteGraphqlBatch(
+        "repo_branch_list",
+        [{"owner": repo["owner"]["login"], "name": repo["name"]} for repo in repositories],
+        batch_size=EM.GRAPHQL_BATCH_SIZE,
+        workers=EM.CRAWLER_WORKERS,
+    )
+
+    # The Most Recently Updated Branch Of Each Repository Usually Holds Most Of The History, So Those Go First
+    # And Let The Remaining Branches Stop Paginating As Soon As They Reach Shared Commits
+    first_branches, other_branches = [], []
+    for repo, branch_data in zip(repositories, branch_lists):
+        if not branch_data:
+            DBM.w(f"\t\tNo Branches Found In {RepositoryName(repo)}. Skipping Repository.")
+            continue
+        CSM.ForgetDeletedBranches(repo["owner"]["login"], repo["name"], [branch["name"] for branch in branch_data])
+        first_branches.append((repo, branch_data[0]))
+        other_branches.extend((repo, branch) for branch in branch_data[1:])
+
+    await UpdateDataWithCommitStats(first_branches, commits, seen_oids)
+    await UpdateDataWithCommitStats(other_branches, commits, seen_oids)
+
+    CSM.Save()
+    commits.Freeze()
+    DBM.g(f"Commit Data Computation Complete, {len(commits)} Commits Counted.")
 
     if EM.DEBUG_RUN:
         from pickle import dump
 
-        with open("./assets/commits_data.pick", "wb") as f:
-            dump([yearly_data, date_data], f)
-        with open("./assets/commits_data.json", "w") as f:
-            f.write(dumps([yearly_data, date_data], indent=2))
+        with open(FM.UserPath("./assets/commits_data.pick"), "wb") as f:
+            dump(commits, f)
+        with open(FM.UserPath("./assets/commits_data.json"), "w") as f:
+            f.write(dumps(commits.YearlyData(), indent=2))
         DBM.g("Commit Data Saved To Cache.")
 
-    return yearly_data, date_data
-
-
-async def UpdateDataWithCommitStats(repo_details: Dict, yearly_data: Dict, date_data: Dict):
-    owner = repo_details["owner"]["login"]
-    branch_data = await DM.GetRemoteGraphql("repo_branch_list", owner=owner, name=repo_details["name"])
-
-    if not branch_data:
-        DBM.w("\t\tNo Branches Found. Skipping Repository.")
-        return
-
-    for branch in branch_data:
-        commits = await DM.GetRemoteGraphql("repo_commit_list", owner=owner, name=repo_details["name"], branch=branch["name"], id=GHM.USER.node_id)
-
-        for commit in commits:
-            commit_date = search(r"\d+-\d+-\d+", commit["committedDate"]).group()
-            parsed_date = datetime.fromisoformat(commit_date)
-            year = parsed_date.year
-            quarter = (parsed_date.month - 1) // 3 + 1
-
-            # Commit timestamp indexing
-            date_data.setdefault(repo_details["name"], {}).setdefault(branch["name"], {})[commit["oid"]] = commit["committedDate"]
-
-            if repo_details["primaryLanguage"]:
-                lang = repo_details["primaryLanguage"]["name"]
-                yearly_data.setdefault(year, {}).setdefault(quarter, {}).setdefault(lang, {"add": 0, "del": 0})
-                yearly_data[year][quarter][lang]["add"] += commit["additions"]
-                yearly_data[year][quarter][lang]["del"] += commit["deletions"]
-
-        if not EM.DEBUG_RUN:
-            await sleep(0.4)
+    return commits
+
+
+def RepositoryName(repo: Dict) -> str:
+    return "[private]" if repo["isPrivate"] else f"{repo['owner']['login']}/{repo['name']}"
+
+
+def Branch(item: Dict) -> Tuple[str, str, str]:
+    return item["owner"], item["name"], item["branch"]
+
+
+async def UpdateDataWithCommitStats(branches: List[Tuple[Dict, Dict]], commits: CommitTable, seen_oids: Optional[Set[str]] = None):
+    seen_oids = set() if seen_oids is None else seen_oids
+    items = [{"owner": repo["owner"]["login"], "name": repo["name"], "branch": branch["name"], "id": GHM.USER.node_id} for repo, branch in branches]
+
+    # Per Branch: Oid Of The Tip, Whether The Stored Tip Was Fetched Again And Where Pagination Stopped At Known History
+    heads = [None] * len(items)
+    met_heads = set()
+    reached_known = dict()
+
+    def Unknown(item: Dict, commit: Dict) -> bool:
+        return commit["oid"] not in seen_oids and not CSM.Contains(*Branch(item), commit["oid"])
+
+    # Merged Branches Interleave Known And Unknown Commits, So Pagination Only Ends After A Page Without Unknown Commits,
+    # Not Counting Those Newer Than The Stored Head Of The Branch. Older Commits Merged In Since The Last Run Sort
+    # Behind The Stored Head, So A Page Ending At The Head Is Followed By One More. A Stored Head That Isn't Fetched
+    # Again Means The Branch Was Rebased Or Force-Pushed, Its Stored History Can't Be Trusted And It Is Walked To The End.
+    def Exhausted(item: Dict, page: List[Dict]) -> bool:
+        oids = [commit["oid"] for commit in page]
+        head = CSM.GetHead(*Branch(item))
+        start = 0
+        if head in oids:
+            met_heads.add(Branch(item))
+            start = oids.index(head) + 1
+        if head is not None and Branch(item) not in met_heads:
+            return False
+        if start == len(page) or any(Unknown(item, commit) for commit in page[start:]):
+            return False
+        reached_known[Branch(item)] = min(commit["committedDate"] for commit in page)
+        return True
+
+    # Branches With A Stored Head Usually Only Have A Handful Of New Commits, So Their First Page Is Kept Small
+    first_page_sizes = [10 if CSM.GetHead(*Branch(item)) else None for item in items]
+
+    def Count(repo_details: Dict, oid: str, date: str, additions: int, deletions: int):
+        if oid in seen_oids:
+            return
+        seen_oids.add(oid)
+        lang = repo_details["primaryLanguage"]["name"] if repo_details["primaryLanguage"] else None
+        commits.Append(repo_details["name"], lang, date, additions, deletions)
+
+    # Pages Are Folded In And Written To The Commit Store As They Arrive While The Next Requests Are Already In Flight
+    stream = DM.StreamRemoteGraphqlBatch(
+        "repo_commit_list", items, stop=Exhausted, batch_size=EM.GRAPHQL_BATCH_SIZE, workers=EM.CRAWLER_WORKERS, first_page_sizes=first_page_sizes
+    )
+    async for index, page, last_page in stream:
+        (repo_details, _), item = branches[index], items[index]
+        if heads[index] is None and page:
+            heads[index] = page[0]["oid"]
+        for commit in page:
+            # Commits Counted On Another Branch Are Skipped, The Ones Around Them Still Count
+            if commit["oid"] not in seen_oids:
+                CSM.Add(*Branch(item), commit)
+                Count(repo_details, commit["oid"], commit["committedDate"], commit["additions"], commit["deletions"])
+
+        if last_page:
+            for oid, (date, additions, deletions) in CSM.Finish(*Branch(item), heads[index], reached_known.get(Branch(item))):
+                Count(repo_details, oid, date, additions, deletions)
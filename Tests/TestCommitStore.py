@@ -0,0 +1,80 @@
+from os import environ
+from os.path import abspath, dirname, join
+from sys import path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from typing import Dict, List
+from unittest import IsolatedAsyncioTestCase, main
+
+from httpx import AsyncClient, MockTransport
+
+# The Action Reads Its Configuration At Import Time, So Everything Is Set Up Before The Sources Are Imported
+environ.setdefault("INPUT_GH_TOKEN", "test")
+environ.setdefault("INPUT_WAKATIME_API_KEY", "test")
+path.insert(0, join(dirname(dirname(abspath(__file__))), "Benchmarks"))
+path.insert(0, join(dirname(dirname(abspath(__file__))), "Sources"))
+
+from SyntheticServer import SyntheticServer  # noqa: E402
+from YearlyCommitCalculater import CalculateCommitData  # noqa: E402
+from ManagerCommitStore import CommitStoreManager as CSM  # noqa: E402
+from ManagerDebug import DebugManager as DBM  # noqa: E402
+from ManagerDownload import DownloadManager as DM  # noqa: E402
+from ManagerEnvironment import EnvironmentManager as EM  # noqa: E402
+from ManagerFile import FileManager as FM  # noqa: E402
+from ManagerGithub import GitHubManager as GHM  # noqa: E402
+
+
+def Commit(oid: str, day: int) -> Dict:
+    return {"oid": oid, "committedDate": f"2024-{day // 28 + 1:02d}-{day % 28 + 1:02d}T12:00:00Z", "additions": 10, "deletions": 1}
+
+
+def History(*commits: List[Dict]) -> List[Dict]:
+    return sorted([commit for part in commits for commit in part], key=lambda commit: commit["committedDate"], reverse=True)
+
+
+class TestCommitStore(IsolatedAsyncioTestCase):
+    # The Main Branch Has 28 Commits, A Feature Branch Forks From Its Fourth One And Adds 2 Commits Made Shortly After
+    def setUp(self):
+        DBM.CreateLogger("ERROR")
+        EM.DEBUG_RUN, EM.COMMIT_CACHE = False, True
+        GHM.USER = SimpleNamespace(login="test", node_id="U_test")
+        self.main = [Commit(f"m{day:02d}", day) for day in range(28)]
+        self.feature = [Commit("f0", 3), Commit("f1", 4)]
+        self.server = SyntheticServer(1, 1, 0, {})
+        self.server._histories["repo0"] = {"main": History(self.main), "feature": History(self.feature, self.main[:4])}
+
+    # Runs Like A Scheduled Job Would, With Only The Store Directory Kept Between Runs
+    async def Run(self, store: str) -> int:
+        FM.STORE_DIR = store
+        CSM._user_id = None
+        DM._client = AsyncClient(transport=MockTransport(self.server.Handle))
+        DM._REMOTE_RESOURCES_CACHE.clear()
+        try:
+            return len(await CalculateCommitData(self.server.repositories))
+        finally:
+            await DM._client.aclose()
+
+    async def RunWarmAndCold(self, store: str) -> List[int]:
+        with TemporaryDirectory() as cold:
+            return [await self.Run(store), await self.Run(cold)]
+
+    async def testRebasedBranchIsCountedOnce(self):
+        with TemporaryDirectory() as store:
+            self.assertEqual(await self.Run(store), 30)
+            rebased = [Commit("f0-rebased", 40), Commit("f1-rebased", 41)]
+            self.server._histories["repo0"]["feature"] = History(rebased, self.main)
+            self.assertEqual(await self.RunWarmAndCold(store), [30, 30])
+            # The Replaced Commits Don't Come Back In Later Runs Either
+            self.assertEqual(await self.Run(store), 30)
+
+    async def testMergedAndDeletedBranchIsKept(self):
+        with TemporaryDirectory() as store:
+            self.assertEqual(await self.Run(store), 30)
+            # The Merge Commit Is Newest, The Merged Commits Sort Behind The First Page Of The Main Branch
+            self.server._histories["repo0"] = {"main": History([Commit("merge", 40)], self.main, self.feature)}
+            self.assertEqual(await self.RunWarmAndCold(store), [31, 31])
+            self.assertEqual(await self.Run(store), 31)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+from datetime import datetime, timedelta, timezone
+from os.path import abspath, dirname, join
+from random import Random
+from sys import path
+from unittest import TestCase, main
+
+from numpy import int64, zeros
+from pytz import timezone as zone
+
+path.insert(0, join(dirname(dirname(abspath(__file__))), "Sources"))
+
+from CommitTable import CommitTable  # noqa: E402
+
+# Zones With Daylight Saving Time, Historical Offset Changes, Half Hour Offsets And Fixed Offsets
+TIME_ZONES = ["UTC", "Europe/Berlin", "America/New_York", "Asia/Kolkata", "Australia/Lord_Howe", "America/Sao_Paulo", "Asia/Tehran", "Etc/GMT+5"]
+
+
+class TestCommitTable(TestCase):
+    # The Bulk Offset Lookup Relies On pytz Internals, So Its Histogram Is Pinned Against Converting Each Commit On Its Own
+    def testDayTimeHistogramMatchesAstimezone(self):
+        random, table, moments = Random(0), CommitTable(), []
+        start = datetime(2005, 1, 1, tzinfo=timezone.utc)
+        for _ in range(20000):
+            moment = start + timedelta(seconds=random.randint(0, 25 * 365 * 86400))
+            moments.append(moment)
+            table.Append("repo", "Python", moment.strftime("%Y-%m-%dT%H:%M:%SZ"), 1, 0)
+        table.Freeze()
+
+        expected = zeros((len(TIME_ZONES), 7, 4), dtype=int64)
+        for index, time_zone in enumerate(TIME_ZONES):
+            for moment in moments:
+                local = moment.astimezone(zone(time_zone))
+                expected[index, local.weekday(), local.hour // 6] += 1
+        self.assertEqual(table.DayTimeHistogram(TIME_ZONES).tolist(), expected.tolist())
+
+
+if __name__ == "__main__":
+    main()